@@ -1,12 +1,58 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
+from PyQt5.QtWidgets import QApplication, QSplashScreen
+from PyQt5.QtGui import QPixmap, QPixmapCache
+from PyQt5.QtCore import Qt, QTimer
+
+# 打包成exe后资源被解压到 sys._MEIPASS 临时目录，源码运行时就是脚本所在目录
+BASE_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+# 全局样式表文件路径
+STYLE_FILE = os.path.join(BASE_DIR, 'ui', 'styles.qss')
+
+# 启动画面图标
+ICON_FILE = os.path.join(BASE_DIR, 'hb.ico')
+
+def load_stylesheet():
+    """加载全局样式表，应用级别只解析一次"""
+    try:
+        with open(STYLE_FILE, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        # 样式表加载失败时不影响程序运行，使用默认样式
+        return ""
 
 if __name__ == "__main__":
+    # 避免为每个子控件创建原生窗口句柄，并合并高频的鼠标/滚轮事件
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+
     app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec_()) 
\ No newline at end of file
+
+    # 调大全局像素图缓存（默认约10MB，这里提到100MB），预览缩略图较多时减少重复解码
+    QPixmapCache.setCacheLimit(102400)
+
+    # 先显示启动画面，让第一帧尽快出现
+    splash = QSplashScreen(QPixmap(ICON_FILE))
+    splash.show()
+    app.processEvents()
+
+    # 样式表解析在启动画面出现之后进行，首帧不用等CSS解析器
+    app.setStyleSheet(load_stylesheet())
+
+    window = None
+
+    def show_main_window():
+        """延迟导入并创建主窗口，重量级导入不再阻塞首帧"""
+        global window
+        from ui.main_window import MainWindow
+        window = MainWindow()
+        window.show()
+        splash.finish(window)
+
+    # 等事件循环跑起来后再加载主窗口模块
+    QTimer.singleShot(0, show_main_window)
+    sys.exit(app.exec_())
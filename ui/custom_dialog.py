@@ -1,13 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import QDialog, QLineEdit, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QDialogButtonBox, QMessageBox
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent
-from PyQt5.QtGui import QIcon, QPixmap
+import sys
+from functools import partial
+
+from PyQt5.QtWidgets import (QDialog, QLineEdit, QLabel, QPushButton, QVBoxLayout,
+                             QHBoxLayout, QStyle, QApplication)
+from PyQt5.QtGui import QIcon
+
+# 图标主题只在Linux桌面环境下可用，其他平台QIcon.fromTheme只是白白扫描磁盘
+_USE_THEME_ICONS = sys.platform.startswith('linux')
 
 class CustomInputDialog(QDialog):
     """自定义的输入对话框，使用中文按钮"""
-    
+
+    # 模板实例，首次调用时构建整套控件，之后只重置文本复用
+    _TEMPLATE = None
+
     def __init__(self, parent=None, title="", label="", default_text=""):
         super().__init__(parent)
         
@@ -17,23 +26,15 @@ class CustomInputDialog(QDialog):
         # 创建主布局
         main_layout = QVBoxLayout(self)
         
-        # 创建提示标签
+        # 创建提示标签（样式由全局样式表按对象名提供）
         self.label = QLabel(label)
-        self.label.setStyleSheet("font-size: 14px; color: #333333;")
+        self.label.setObjectName("dialogLabel")
         main_layout.addWidget(self.label)
-        
+
         # 创建输入框
         self.line_edit = QLineEdit(default_text)
         self.line_edit.setMinimumHeight(35)
-        self.line_edit.setStyleSheet("""
-            padding: 0px 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background-color: white;
-            color: #333333;
-            font-size: 14px;
-            min-height: 35px;
-        """)
+        self.line_edit.setObjectName("dialogLineEdit")
         main_layout.addWidget(self.line_edit)
         
         # 添加空间
@@ -45,47 +46,12 @@ class CustomInputDialog(QDialog):
         
         # 创建确定按钮
         self.ok_button = QPushButton("确定")
-        self.ok_button.setMinimumWidth(100)
-        self.ok_button.setMinimumHeight(35)
-        self.ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4d8bf0;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a7bd5;
-            }
-            QPushButton:pressed {
-                background-color: #2a5db0;
-            }
-        """)
+        self.ok_button.setObjectName("primaryButton")
         self.ok_button.clicked.connect(self.accept)
         
         # 创建取消按钮
         self.cancel_button = QPushButton("取消")
-        self.cancel_button.setMinimumWidth(100)
-        self.cancel_button.setMinimumHeight(35)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #333333;
-                border: 1px solid #d0d0d0;
-                padding: 8px 16px;
-                font-size: 14px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-        """)
+        self.cancel_button.setObjectName("secondaryButton")
         self.cancel_button.clicked.connect(self.reject)
         
         # 添加按钮到布局
@@ -108,9 +74,21 @@ class CustomInputDialog(QDialog):
     @staticmethod
     def get_text_input(parent=None, title="", label="", default_text=""):
         """静态方法，显示对话框并获取输入文本"""
-        dialog = CustomInputDialog(parent, title, label, default_text)
+        dialog = CustomInputDialog._TEMPLATE
+        if dialog is None:
+            # 模板对话框不设置parent，避免随父窗口一起被销毁
+            dialog = CustomInputDialog(None, title, label, default_text)
+            CustomInputDialog._TEMPLATE = dialog
+        else:
+            # 复用模板，只重置标题和文本内容
+            dialog.setWindowTitle(title)
+            # 提示文本通常不变，跳过相同内容的setText以省去标签重排版
+            if dialog.label.text() != label:
+                dialog.label.setText(label)
+            dialog.line_edit.setText(default_text)
+        dialog.line_edit.setFocus()
         result = dialog.exec_()
-        
+
         if result == QDialog.Accepted:
             return dialog.get_text(), True
         else:
@@ -131,14 +109,65 @@ class CustomMessageBox(QDialog):
     Cancel = 1
     Yes = 2
     No = 3
-    
+
+    # 图标缓存，首次使用时生成，后续弹窗直接复用，避免每次重新光栅化
+    _ICON_CACHE = {}
+    _THEME_ICON_CACHE = {}
+
+    # 对话框实例池，按(消息类型, 按钮组合)复用，免去每次弹窗重建整套控件
+    _POOL = {}
+
+    # 按钮构建表：(按钮标志, 属性名, 按钮文字, 对象名, 是否为默认按钮)
+    # 预先编好表后按序遍历创建，替代四段重复的if分支
+    _BUTTON_TABLE = (
+        (Ok, 'ok_button', "确定", "primaryButton", True),
+        (Cancel, 'cancel_button', "取消", "secondaryButton", False),
+        (Yes, 'yes_button', "是", "primaryButton", True),
+        (No, 'no_button', "否", "secondaryButton", False),
+    )
+
+    # 消息类型对应的标准图标和主题图标名称
+    _MSGBOX_ICON_MAP = {
+        Information: (QStyle.SP_MessageBoxInformation, "dialog-information"),
+        Warning: (QStyle.SP_MessageBoxWarning, "dialog-warning"),
+        Critical: (QStyle.SP_MessageBoxCritical, "dialog-error"),
+        Question: (QStyle.SP_MessageBoxQuestion, "dialog-question"),
+    }
+
+    @classmethod
+    def _icon_for(cls, msg_type):
+        """获取消息类型对应的图标QPixmap，带类级缓存"""
+        pixmap = cls._ICON_CACHE.get(msg_type)
+        if pixmap is None:
+            standard_icon, _ = cls._MSGBOX_ICON_MAP[msg_type]
+            # 直接走样式引擎取标准图标，避免QMessageBox.standardIcon内部的临时对象开销
+            pixmap = QApplication.style().standardIcon(standard_icon).pixmap(48, 48)
+            cls._ICON_CACHE[msg_type] = pixmap
+        return pixmap
+
+    @classmethod
+    def _theme_icon_for(cls, msg_type):
+        """获取消息类型对应的主题QIcon，带类级缓存"""
+        icon = cls._THEME_ICON_CACHE.get(msg_type)
+        if icon is None:
+            _, theme_name = cls._MSGBOX_ICON_MAP[msg_type]
+            icon = QIcon.fromTheme(theme_name)
+            cls._THEME_ICON_CACHE[msg_type] = icon
+        return icon
+
     def __init__(self, parent=None, title="", text="", msg_type=Information, buttons=Ok):
         super().__init__(parent)
         
         self.setWindowTitle(title)
         self.resize(400, 180)
         self.setModal(True)
-        
+
+        # 预先初始化按钮属性，未创建的按钮保持None，避免后面用hasattr探测
+        self.ok_button = None
+        self.cancel_button = None
+        self.yes_button = None
+        self.no_button = None
+
         # 创建主布局
         main_layout = QVBoxLayout(self)
         
@@ -149,23 +178,11 @@ class CustomMessageBox(QDialog):
         self.icon_label = QLabel()
         self.icon_label.setFixedSize(48, 48)
         
-        # 设置图标
-        if msg_type == CustomMessageBox.Information:
-            self.setWindowIcon(QIcon.fromTheme("dialog-information"))
-            pixmap = QMessageBox.standardIcon(QMessageBox.Information)
-            self.icon_label.setPixmap(pixmap)
-        elif msg_type == CustomMessageBox.Warning:
-            self.setWindowIcon(QIcon.fromTheme("dialog-warning"))
-            pixmap = QMessageBox.standardIcon(QMessageBox.Warning)
-            self.icon_label.setPixmap(pixmap)
-        elif msg_type == CustomMessageBox.Critical:
-            self.setWindowIcon(QIcon.fromTheme("dialog-error"))
-            pixmap = QMessageBox.standardIcon(QMessageBox.Critical)
-            self.icon_label.setPixmap(pixmap)
-        elif msg_type == CustomMessageBox.Question:
-            self.setWindowIcon(QIcon.fromTheme("dialog-question"))
-            pixmap = QMessageBox.standardIcon(QMessageBox.Question)
-            self.icon_label.setPixmap(pixmap)
+        # 设置图标（使用类级缓存，避免每次弹窗重新生成）
+        if msg_type in CustomMessageBox._MSGBOX_ICON_MAP:
+            if _USE_THEME_ICONS:
+                self.setWindowIcon(self._theme_icon_for(msg_type))
+            self.icon_label.setPixmap(self._icon_for(msg_type))
         
         message_layout.addWidget(self.icon_label)
         message_layout.addSpacing(15)
@@ -173,7 +190,7 @@ class CustomMessageBox(QDialog):
         # 创建消息文本标签
         self.text_label = QLabel(text)
         self.text_label.setWordWrap(True)
-        self.text_label.setStyleSheet("font-size: 14px; color: #333333;")
+        self.text_label.setObjectName("dialogLabel")
         message_layout.addWidget(self.text_label, 1)
         
         main_layout.addLayout(message_layout)
@@ -186,142 +203,76 @@ class CustomMessageBox(QDialog):
         # 记录用户点击的按钮
         self.clicked_button = None
         
-        # 添加按钮
-        if buttons & CustomMessageBox.Ok:
-            self.ok_button = QPushButton("确定")
-            self.ok_button.setMinimumWidth(100)
-            self.ok_button.setMinimumHeight(35)
-            self.ok_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4d8bf0;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #3a7bd5;
-                }
-                QPushButton:pressed {
-                    background-color: #2a5db0;
-                }
-            """)
-            self.ok_button.clicked.connect(lambda: self._button_clicked(CustomMessageBox.Ok))
-            # 设置为默认按钮，这样回车键会自动触发
-            self.ok_button.setDefault(True)
-            self.ok_button.setAutoDefault(True)
-            button_layout.addWidget(self.ok_button)
-        
-        if buttons & CustomMessageBox.Cancel:
-            self.cancel_button = QPushButton("取消")
-            self.cancel_button.setMinimumWidth(100)
-            self.cancel_button.setMinimumHeight(35)
-            self.cancel_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    color: #333333;
-                    border: 1px solid #d0d0d0;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-            """)
-            self.cancel_button.clicked.connect(lambda: self._button_clicked(CustomMessageBox.Cancel))
-            button_layout.addWidget(self.cancel_button)
-        
-        if buttons & CustomMessageBox.Yes:
-            self.yes_button = QPushButton("是")
-            self.yes_button.setMinimumWidth(100)
-            self.yes_button.setMinimumHeight(35)
-            self.yes_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4d8bf0;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #3a7bd5;
-                }
-                QPushButton:pressed {
-                    background-color: #2a5db0;
-                }
-            """)
-            self.yes_button.clicked.connect(lambda: self._button_clicked(CustomMessageBox.Yes))
-            # 设置为默认按钮，这样回车键会自动触发
-            self.yes_button.setDefault(True)
-            self.yes_button.setAutoDefault(True)
-            button_layout.addWidget(self.yes_button)
-        
-        if buttons & CustomMessageBox.No:
-            self.no_button = QPushButton("否")
-            self.no_button.setMinimumWidth(100)
-            self.no_button.setMinimumHeight(35)
-            self.no_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    color: #333333;
-                    border: 1px solid #d0d0d0;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-            """)
-            self.no_button.clicked.connect(lambda: self._button_clicked(CustomMessageBox.No))
-            button_layout.addWidget(self.no_button)
+        # 按构建表批量创建按钮
+        for flag, attr_name, btn_text, object_name, is_default in CustomMessageBox._BUTTON_TABLE:
+            if not buttons & flag:
+                continue
+            button = QPushButton(btn_text)
+            button.setObjectName(object_name)
+            button.clicked.connect(partial(self._button_clicked, flag))
+            if is_default:
+                # 设置为默认按钮，这样回车键会自动触发
+                button.setDefault(True)
+                button.setAutoDefault(True)
+            setattr(self, attr_name, button)
+            button_layout.addWidget(button)
         
         main_layout.addLayout(button_layout)
         
         # 设置焦点到第一个按钮
-        if hasattr(self, 'ok_button'):
+        if self.ok_button is not None:
             self.ok_button.setFocus()
-        elif hasattr(self, 'yes_button'):
+        elif self.yes_button is not None:
             self.yes_button.setFocus()
         
-    def _button_clicked(self, button):
+    def _button_clicked(self, button, checked=False):
         """记录用户点击的按钮并关闭对话框"""
         self.clicked_button = button
         self.accept()
     
+    @classmethod
+    def _pooled(cls, msg_type, buttons, title, text):
+        """获取可复用的对话框实例并重置其内容"""
+        key = (msg_type, buttons)
+        dialog = cls._POOL.get(key)
+        if dialog is None:
+            # 池中的对话框不设置parent，避免随父窗口一起被销毁
+            dialog = cls(None, "", "", msg_type, buttons)
+            cls._POOL[key] = dialog
+        elif dialog.isVisible():
+            # 池中实例还在exec_()里（嵌套弹窗），不能复用：改写内容会
+            # 覆盖第一个弹窗的结果，重入exec_()也会被Qt拒绝，退回临时实例
+            return cls(None, title, text, msg_type, buttons)
+        dialog.setWindowTitle(title)
+        # 内容没有变化时跳过setText，避免相同文本重复触发QLabel重排版
+        if dialog.text_label.text() != text:
+            dialog.text_label.setText(text)
+        dialog.clicked_button = None
+        return dialog
+
     @staticmethod
     def information(parent, title, text):
         """显示信息对话框"""
-        dialog = CustomMessageBox(parent, title, text, CustomMessageBox.Information, CustomMessageBox.Ok)
+        dialog = CustomMessageBox._pooled(CustomMessageBox.Information, CustomMessageBox.Ok, title, text)
         dialog.exec_()
-    
+
     @staticmethod
     def warning(parent, title, text):
         """显示警告对话框"""
-        dialog = CustomMessageBox(parent, title, text, CustomMessageBox.Warning, CustomMessageBox.Ok)
+        dialog = CustomMessageBox._pooled(CustomMessageBox.Warning, CustomMessageBox.Ok, title, text)
         dialog.exec_()
-    
+
     @staticmethod
     def critical(parent, title, text):
         """显示错误对话框"""
-        dialog = CustomMessageBox(parent, title, text, CustomMessageBox.Critical, CustomMessageBox.Ok)
+        dialog = CustomMessageBox._pooled(CustomMessageBox.Critical, CustomMessageBox.Ok, title, text)
         dialog.exec_()
-    
+
     @staticmethod
     def question(parent, title, text):
         """显示问题对话框，返回用户选择的按钮"""
-        dialog = CustomMessageBox(parent, title, text, CustomMessageBox.Question, 
-                                 CustomMessageBox.Yes | CustomMessageBox.No | CustomMessageBox.Cancel)
+        dialog = CustomMessageBox._pooled(CustomMessageBox.Question,
+                                          CustomMessageBox.Yes | CustomMessageBox.No | CustomMessageBox.Cancel,
+                                          title, text)
         dialog.exec_()
         return dialog.clicked_button 
\ No newline at end of file
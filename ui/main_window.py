@@ -2,37 +2,104 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import sys
 import json
+import copy
+import hashlib
+import pathlib
 import datetime
 import logging
 import tempfile
 import shutil
-import glob
 import time
 import subprocess
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                           QLabel, QPushButton, QFileDialog, QLineEdit, 
-                           QProgressBar, QMessageBox, QInputDialog, QApplication,
-                           QTextEdit, QTabWidget, QSplitter, QStackedWidget, 
-                           QListWidget, QListWidgetItem, QFrame, QGridLayout,
-                           QGroupBox, QFormLayout, QScrollArea, QListView,
-                           QCheckBox)
-from PyQt5.QtGui import (QIcon, QFont, QPixmap, QTextCursor, QColor, QStandardItemModel, 
-                       QStandardItem, QImage, QPainter, QBrush, QPen, QPainterPath)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QByteArray
-
-from utils.wechat_parser import WeChatParser
-from utils.archive_parser import ArchiveParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                           QLabel, QPushButton, QFileDialog, QLineEdit,
+                           QProgressBar, QMessageBox, QStackedWidget,
+                           QListWidget, QListView, QFrame,
+                           QGroupBox, QCheckBox, QTextBrowser, QPlainTextEdit)
+from PyQt5.QtGui import (QIcon, QPixmap, QImage, QImageReader, QStandardItemModel,
+                         QStandardItem, QPainter, QColor)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QSize, QTimer, QUrl,
+                          QSignalBlocker, QObject, QRunnable, QThreadPool,
+                          QStandardPaths)
+
 from ui.custom_dialog import CustomInputDialog, CustomMessageBox
 
+# 关于页HTML文件路径（打包后位于 sys._MEIPASS 解压目录下）
+if hasattr(sys, '_MEIPASS'):
+    ABOUT_HTML_FILE = os.path.join(sys._MEIPASS, 'ui', 'resources', 'about.html')
+else:
+    ABOUT_HTML_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'about.html')
+
+# 侧边栏菜单项（名称, 图标名），不可变元组在模块加载时构建一次
+MENU_ITEMS = (
+    ("主页", "home"),
+    ("设置", "settings"),
+    ("日志", "log"),
+    ("关于", "about"),
+)
+
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+class _StartupLogBuffer(logging.Handler):
+    """日志页构建前的兜底处理器
+
+    日志页改为懒加载后，自动检测、解析等启动期日志可能先于
+    日志控件产生，先在这里攒下record，日志页首次构建时整批
+    转交给QTextEditLogger，保证日志页打开时历史完整
+    """
+    MAX_RECORDS = 2000  # 与控件的最大行数同量级，防止无限堆积
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        if len(self.records) < self.MAX_RECORDS:
+            self.records.append(record)
+
+    def drain(self):
+        """取走全部缓冲记录并从根日志器上摘除自己"""
+        records = self.records
+        self.records = []
+        logging.getLogger().removeHandler(self)
+        return records
+
+
+# 在模块加载时就挂到根日志器上，晚于日志页构建的不会经过它
+_startup_log_buffer = _StartupLogBuffer()
+logging.getLogger().addHandler(_startup_log_buffer)
+
+# JSON快速通道：优先使用orjson（解析/序列化比标准库快数倍），未安装时退回标准库
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=4).encode("utf-8")
+
 # 应用程序配置文件路径
+@lru_cache(maxsize=1)
 def get_config_path():
-    """获取配置文件路径，存储在用户的AppData目录中"""
+    """获取配置文件路径，存储在用户的AppData目录中
+
+    结果在进程内缓存，目录探测和创建只发生一次
+    """
     app_name = "微信收藏解析助手"
     if sys.platform == 'win32':
         app_data = os.environ.get('APPDATA', '')
@@ -45,18 +112,15 @@ def get_config_path():
     else:  # Linux和其他Unix系统
         config_dir = os.path.join(os.path.expanduser('~'), '.config', app_name)
     
-    # 确保配置目录存在
-    if not os.path.exists(config_dir):
-        try:
-            os.makedirs(config_dir)
-        except Exception as e:
-            logger.error(f"创建配置目录失败: {str(e)}")
-            # 如果无法创建目录，回退到程序运行目录
-            return "config.json"
-    
-    return os.path.join(config_dir, "config.json")
+    # 确保配置目录存在，mkdir一次调用完成探测和创建
+    try:
+        pathlib.Path(config_dir).mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error(f"创建配置目录失败: {str(e)}")
+        # 如果无法创建目录，回退到程序运行目录
+        return "config.json"
 
-CONFIG_FILE = get_config_path()
+    return os.path.join(config_dir, "config.json")
 
 # 默认配置
 DEFAULT_CONFIG = {
@@ -65,29 +129,421 @@ DEFAULT_CONFIG = {
     "auto_clear_cache": False  # 默认不自动清除缓存
 }
 
+# 配置文件的内存缓存，文件mtime没变时跳过重新读取和JSON解析
+_CONFIG_CACHE = {"mtime": None, "data": None}
+
+# 文件名中的非法字符，模块加载时编译一次
+UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+# 预览条目上暂存待解码图片路径的角色（Qt.UserRole存的是文件信息）
+THUMB_PENDING_ROLE = Qt.UserRole + 1
+
+# 清除缓存时匹配的媒体文件扩展名（小写、不含点）
+CLEAR_MEDIA_EXTS = frozenset((
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp',
+    'mp4', 'mov', 'avi', 'mkv', 'wmv', 'flv',
+))
+
+# 预览时按扩展名区分图片和视频（小写、不含点）
+IMAGE_EXTS = frozenset(('jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp'))
+VIDEO_EXTS = frozenset(('mp4', 'mov', 'avi', 'mkv', 'wmv', 'flv'))
+
+def _iter_media_files(path):
+    """递归遍历目录，产出媒体文件路径
+
+    基于os.scandir：目录项自带文件/目录类型信息，无需逐个stat
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError as e:
+        logger.warning(f"遍历目录失败: {path}, 错误: {str(e)}")
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_media_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if entry.name.rpartition('.')[2].lower() in CLEAR_MEDIA_EXTS:
+                        yield entry.path
+            except OSError:
+                continue
+
+def _fast_copy(src, dst):
+    """快速拷贝文件并保留修改时间
+
+    优先os.copy_file_range（数据在内核内流转，不经过用户态），
+    其次os.sendfile，两者都不可用（如Windows）时退回1MiB缓冲的copyfileobj
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd = fsrc.fileno()
+        out_fd = fdst.fileno()
+        st = os.fstat(in_fd)
+        size = st.st_size
+        copied = 0
+        try:
+            while copied < size:
+                sent = os.copy_file_range(in_fd, out_fd, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except (AttributeError, OSError):
+            try:
+                fsrc.seek(copied)
+                while copied < size:
+                    sent = os.sendfile(out_fd, in_fd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except (AttributeError, OSError):
+                fsrc.seek(copied)
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+                copied = size
+    # 复用上面fstat的结果回写时间戳，省掉copy2里额外的一次stat
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return size
+
+def _rmtree_ignore(*_args):
+    """rmtree的错误回调，模块级定义避免每次调用都新建闭包"""
+    pass
+
+def _safe_unlink(file_path):
+    """删除单个文件，成功返回1，失败记录日志并返回0"""
+    try:
+        os.remove(file_path)
+        return 1
+    except Exception as e:
+        logger.warning(f"删除文件失败: {file_path}, 错误: {str(e)}")
+        return 0
+
+@lru_cache(maxsize=None)
+def _badge_icon(text, color):
+    """渲染占位图标（圆角色块加文字），同类条目共享同一个QIcon
+
+    QIcon内部引用计数共享像素数据，视频/普通文件各画一次即可，
+    只能在GUI线程调用
+    """
+    pixmap = QPixmap(160, 160)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawRoundedRect(20, 20, 120, 120, 16, 16)
+    painter.setPen(QColor("white"))
+    font = painter.font()
+    font.setPointSize(18)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.drawText(20, 20, 120, 120, Qt.AlignCenter, text)
+    painter.end()
+    return QIcon(pixmap)
+
+@lru_cache(maxsize=1)
+def _cached_wxid():
+    """获取当前登录的wxid，文件系统/注册表扫描在进程内只做一次"""
+    from utils.wechat_parser import WeChatParser
+    return WeChatParser.get_current_wxid()
+
+@lru_cache(maxsize=1)
+def _detect_favorites_path():
+    """扫描微信收藏路径，结果缓存，用户主动重新检测时调用cache_clear"""
+    from utils.wechat_parser import WeChatParser
+    return WeChatParser.get_favorites_path()
+
 class QTextEditLogger(logging.Handler):
-    """将日志重定向到QTextEdit的处理器"""
+    """将日志重定向到QPlainTextEdit的处理器
+
+    日志先写入缓冲区，由定时器每50ms合并成一次append，
+    密集日志时只触发一次文本重排版，而不是每条记录一次
+    """
     def __init__(self, widget):
         super().__init__()
         self.widget = widget
         self.widget.setReadOnly(True)
-        
+        # 限制最大行数，防止长时间运行后日志控件无限占用内存
+        self.widget.document().setMaximumBlockCount(5000)
+
+        self._buffer = []
+        # 定时器在主线程创建并启动，工作线程的日志也统一在主线程刷入控件
+        self._flush_timer = QTimer()
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start()
+
     def emit(self, record):
-        msg = self.format(record)
-        self.widget.append(msg)
-        self.widget.moveCursor(QTextCursor.End)
-        
+        # 只入队原始record，格式化和append都推迟到定时器里做，
+        # 工作线程打日志的开销只剩一次list.append
+        self._buffer.append(record)
+
+    def _flush(self):
+        """把缓冲的日志一次性格式化并追加到控件
+
+        只有原本就停在底部时才跟随滚动，用户上翻查看旧日志时
+        不抢占滚动位置，也省掉无谓的光标移动和重绘
+        """
+        if not self._buffer or self.widget is None:
+            return
+        records = self._buffer
+        self._buffer = []
+        text = "\n".join(self.format(record) for record in records)
+        scrollbar = self.widget.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.widget.appendPlainText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
     def close(self):
         """安全地关闭日志处理器"""
         try:
+            self._flush_timer.stop()
+            self._buffer.clear()
             # 移除所有日志处理器
             logger = logging.getLogger()
             if self in logger.handlers:
                 logger.removeHandler(self)
-            self.widget = None  # 清除对QTextEdit的引用
+            self.widget = None  # 清除对日志控件的引用
         except:
             pass
 
+class ThumbnailCache:
+    """磁盘缩略图缓存，按(路径, 修改时间, 大小)判定命中
+
+    缓存文件名由路径哈希加mtime_ns和文件大小组成，源文件一有改动
+    旧缓存名就对不上而自然失效，命中校验只需一次os.stat
+    """
+
+    MAX_BYTES = 500 * 1024 * 1024  # 缓存目录大小上限
+
+    def __init__(self):
+        base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        self.cache_dir = os.path.join(base, 'thumbnails') if base else ''
+        self._ready = False
+        self._pruned = False
+
+    def _ensure_dir(self):
+        if not self._ready and self.cache_dir:
+            try:
+                pathlib.Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+                self._ready = True
+            except Exception as e:
+                logger.warning(f"创建缩略图缓存目录失败: {str(e)}")
+                self.cache_dir = ''
+        return self._ready
+
+    def _cache_path(self, file_path, st, ext):
+        key = hashlib.blake2b(file_path.encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}_{st.st_mtime_ns}_{st.st_size}.{ext}")
+
+    def load(self, file_path):
+        """命中时返回缓存的QImage，未命中返回None"""
+        if not self.cache_dir:
+            return None
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        # 不透明图存JPEG、带透明通道的存PNG，两种后缀都查一遍
+        for ext in ('jpg', 'png'):
+            cache_file = self._cache_path(file_path, st, ext)
+            if os.path.exists(cache_file):
+                image = QImage(cache_file)
+                if not image.isNull():
+                    return image
+        return None
+
+    def store(self, file_path, image):
+        """把解码好的缩略图写入缓存"""
+        if not self._ensure_dir():
+            return
+        try:
+            st = os.stat(file_path)
+            if image.hasAlphaChannel():
+                # JPEG没有透明通道，带alpha的缩略图改存PNG，避免命中后黑底
+                image.save(self._cache_path(file_path, st, 'png'), 'PNG')
+            else:
+                image.save(self._cache_path(file_path, st, 'jpg'), 'JPEG', 85)
+            self._prune()
+        except Exception as e:
+            logger.debug(f"写入缩略图缓存失败: {file_path}, 错误: {str(e)}")
+
+    def _prune(self):
+        """超出上限时按访问时间从旧到新清理，每次运行只做一遍"""
+        if self._pruned:
+            return
+        self._pruned = True
+        try:
+            entries = [(e.stat(), e.path) for e in os.scandir(self.cache_dir) if e.is_file()]
+            total = sum(st.st_size for st, _ in entries)
+            if total <= self.MAX_BYTES:
+                return
+            entries.sort(key=lambda x: x[0].st_atime)
+            for st, path in entries:
+                try:
+                    os.remove(path)
+                    total -= st.st_size
+                except OSError:
+                    continue
+                if total <= self.MAX_BYTES:
+                    break
+        except Exception as e:
+            logger.debug(f"清理缩略图缓存失败: {str(e)}")
+
+# 进程级共享的缩略图缓存，线程池中的加载器直接读写
+_THUMB_CACHE = ThumbnailCache()
+
+class ThumbnailSignals(QObject):
+    """缩略图加载结果信号，跨线程把解码好的QImage送回GUI线程"""
+    loaded = pyqtSignal(object, QImage)
+    failed = pyqtSignal(object, str)
+
+class WxidSignals(QObject):
+    """wxid检测结果信号，跨线程送回GUI线程"""
+    detected = pyqtSignal(str)
+
+class WxidDetectWorker(QRunnable):
+    """在线程池中检测当前登录的wxid
+
+    注册表/文件系统扫描可能较慢，放到后台执行，
+    设置页首次绘制不再被检测过程阻塞
+    """
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        try:
+            wxid = _cached_wxid()
+        except Exception as e:
+            logger.error(f"获取wxid失败: {str(e)}")
+            wxid = None
+        self.signals.detected.emit(wxid or "")
+
+# 常见图片格式的魔数，见 https://en.wikipedia.org/wiki/List_of_file_signatures
+_IMAGE_MAGICS = (b'\xff\xd8\xff', b'\x89PNG', b'GIF8', b'BM')
+
+def _looks_like_image(file_path):
+    """只读文件头16字节判断是否为可解码的图片
+
+    缓存目录里可能混入扩展名伪装成图片的文件，先嗅探魔数，
+    避免QImageReader对坏文件做完整的插件探测和解码尝试
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    if header.startswith(_IMAGE_MAGICS):
+        return True
+    # WEBP: RIFF????WEBP
+    return header[:4] == b'RIFF' and header[8:12] == b'WEBP'
+
+class ThumbnailLoader(QRunnable):
+    """在线程池中解码图片缩略图
+
+    用QImageReader.setScaledSize在解码阶段就缩放到目标尺寸，
+    JPEG可走DCT域降采样，不必解码整张原图再丢弃绝大部分像素
+    """
+    def __init__(self, file_path, item, signals):
+        super().__init__()
+        self.file_path = file_path
+        self.item = item
+        self.signals = signals
+
+    def run(self):
+        try:
+            # 先查磁盘缓存，命中时完全跳过原图解码
+            cached = _THUMB_CACHE.load(self.file_path)
+            if cached is not None:
+                self.signals.loaded.emit(self.item, cached)
+                return
+
+            # 魔数不对的文件直接按失败处理，不进解码器
+            if not _looks_like_image(self.file_path):
+                self.signals.failed.emit(self.item, self.file_path)
+                return
+
+            reader = QImageReader(self.file_path)
+            reader.setAutoTransform(True)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(160, 160, Qt.KeepAspectRatio))
+            image = reader.read()
+
+            # 头部信息异常时退回整体读入再缩放
+            if image.isNull():
+                image = QImage(self.file_path)
+                if not image.isNull():
+                    image = image.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+            if not image.isNull():
+                _THUMB_CACHE.store(self.file_path, image)
+                self.signals.loaded.emit(self.item, image)
+            else:
+                self.signals.failed.emit(self.item, self.file_path)
+        except Exception as e:
+            logger.error(f"后台加载图片预览出错: {self.file_path}, 错误: {str(e)}")
+            self.signals.failed.emit(self.item, self.file_path)
+
+class TempCleanupWorker(QRunnable):
+    """后台删除压缩包解析产生的临时目录
+
+    rmtree、rd强制删除和重试间的等待可能耗时数秒，
+    放进线程池执行，事件循环不被磁盘I/O卡住
+    """
+    def __init__(self, dir_paths):
+        super().__init__()
+        self.dir_paths = dir_paths
+
+    def run(self):
+        for dir_path in self.dir_paths:
+            try:
+                logger.info(f"尝试删除临时目录: {dir_path}")
+
+                # 句柄释放由force_close_handles负责，这里不再把整棵目录树
+                # 的文件挨个open/close一遍——那只会新开句柄，删不掉的目录
+                # 交给下面的rd强制删除兜底
+
+                # 第一次尝试删除
+                shutil.rmtree(dir_path, ignore_errors=True)
+                            
+                # 检查目录是否还存在
+                if os.path.exists(dir_path):
+                    logger.warning(f"第一次删除失败，尝试强制删除: {dir_path}")
+                                
+                    # 在Windows上使用rd命令强制删除
+                    if os.name == 'nt':
+                        try:
+                            # 使用rd /s /q命令强制删除目录
+                            subprocess.run(['rd', '/s', '/q', dir_path], 
+                                          shell=True, 
+                                          stdout=subprocess.PIPE, 
+                                          stderr=subprocess.PIPE)
+                        except:
+                            pass
+                                
+                    # 等待一小段时间
+                    time.sleep(0.5)
+                                
+                    # 再次尝试Python方式删除
+                    if os.path.exists(dir_path):
+                        try:
+                            shutil.rmtree(dir_path, ignore_errors=True)
+                        except:
+                            pass
+                                
+                    # 最后检查是否删除成功
+                    if os.path.exists(dir_path):
+                        logger.error(f"无法删除临时目录，可能被其他进程占用: {dir_path}")
+                    else:
+                        logger.info(f"临时目录成功删除: {dir_path}")
+                else:
+                    logger.info(f"临时目录成功删除: {dir_path}")
+            except Exception as e:
+                logger.error(f"删除临时目录失败: {dir_path}, 错误: {str(e)}")
+            
+        logger.info("临时目录清理完成")
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -96,14 +552,34 @@ class MainWindow(QMainWindow):
         
         # 加载配置
         self.config = self.load_config()
-        
-        # 如果配置中没有缓存路径，尝试自动获取
+
+        # 缩略图后台解码线程池和回传信号
+        self._thumb_pool = QThreadPool.globalInstance()
+        self._thumb_signals = ThumbnailSignals(self)
+        self._thumb_signals.loaded.connect(self._thumbnail_loaded)
+        self._thumb_signals.failed.connect(self._thumbnail_failed)
+
+        # 新发现的预览条目先入队，由定时器每100ms批量插入模型一次
+        self._pending_previews = []
+        self._preview_flush_timer = QTimer(self)
+        self._preview_flush_timer.setInterval(100)
+        self._preview_flush_timer.timeout.connect(self._flush_preview_queue)
+
+        # 进度/状态槽函数的节流状态
+        self._last_progress_ts = 0.0
+        self._last_status_msg = None
+
+        # 配置写盘做500ms去抖，连续的设置变更合并成一次磁盘写入
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(500)
+        self._config_save_timer.timeout.connect(self._flush_config)
+        
+        # 如果配置中没有缓存路径，等窗口画出第一帧后再自动获取，
+        # 避免目录扫描阻塞启动
         if not self.config.get("cache_path"):
-            self.auto_detect_cache_path()
-        
-        # 设置样式
-        self.setup_style()
-        
+            QTimer.singleShot(0, self.auto_detect_cache_path)
+
         # 初始化UI
         self.init_ui()
         
@@ -115,14 +591,9 @@ class MainWindow(QMainWindow):
             # 先清理日志处理器
             self.cleanup_logger()
             
-            # 直接清理临时文件，不记录日志
-            import shutil
-            import glob
-            import tempfile
-            import os
-            
             # 尝试关闭所有文件句柄
-            if hasattr(self, 'archive_parser_thread') and hasattr(self.archive_parser_thread, 'parser'):
+            if hasattr(self, 'archive_parser_thread') and hasattr(self.archive_parser_thread, 'parser') \
+                    and not self.archive_parser_thread.isRunning():
                 parser = self.archive_parser_thread.parser
                 if parser and hasattr(parser, 'file_handles'):
                     for handle in parser.file_handles:
@@ -131,164 +602,29 @@ class MainWindow(QMainWindow):
                         except:
                             pass
             
-            # 清理临时目录
+            # 清理临时目录：一次scandir按前缀过滤，DirEntry自带类型信息不用额外stat
             temp_dir = tempfile.gettempdir()
-            patterns = ['archive_extract_*', 'safe_archive_*']
-            
-            for pattern in patterns:
-                matching_dirs = glob.glob(os.path.join(temp_dir, pattern))
-                for dir_path in matching_dirs:
-                    if os.path.isdir(dir_path):
+            prefixes = ('archive_extract_', 'safe_archive_')
+
+            with os.scandir(temp_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(prefixes) and entry.is_dir(follow_symlinks=False):
                         try:
-                            shutil.rmtree(dir_path, ignore_errors=True)
+                            if os.name == 'nt':
+                                # 退出阶段把删除交给分离的子进程，窗口关闭不等磁盘I/O
+                                subprocess.Popen(
+                                    ['cmd', '/c', 'rmdir', '/s', '/q', entry.path],
+                                    creationflags=subprocess.DETACHED_PROCESS,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+                            else:
+                                shutil.rmtree(entry.path, onerror=_rmtree_ignore)
                         except:
                             pass
         except:
             # 捕获所有异常但不处理，避免在析构函数中引发异常
             pass
     
-    def setup_style(self):
-        """设置应用程序样式"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f7fa;
-                color: #333333;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #333333;
-            }
-            QPushButton {
-                background-color: #4d8bf0;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                min-height: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a7bd5;
-            }
-            QPushButton:pressed {
-                background-color: #2a5db0;
-            }
-            QPushButton:disabled {
-                background-color: #b0b0b0;
-                color: #e0e0e0;
-            }
-            QLineEdit {
-                padding: 0px 10px;
-                border: 1px solid #d0d0d0;
-                border-radius: 6px;
-                background-color: white;
-                color: #333333;
-                font-size: 14px;
-                min-height: 35px;
-                qproperty-alignment: AlignCenter;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4d8bf0;
-            }
-            QProgressBar {
-                border: none;
-                border-radius: 6px;
-                background-color: #e8e8e8;
-                text-align: center;
-                min-height: 12px;
-                color: #333333;
-            }
-            QProgressBar::chunk {
-                background-color: #4d8bf0;
-                border-radius: 6px;
-            }
-            QListWidget {
-                background-color: #3a7bd5;
-                border: none;
-                outline: none;
-                font-size: 15px;
-                padding: 10px 0;
-                border-radius: 0px 10px 10px 0px;
-            }
-            QListWidget::item {
-                color: white;
-                padding: 15px 24px;
-                border-left: 3px solid transparent;
-                margin-bottom: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #2a5db0;
-                color: white;
-                border-left: 3px solid white;
-                font-weight: bold;
-            }
-            QListWidget::item:hover {
-                background-color: #4d8bf0;
-            }
-            QFrame#content {
-                background-color: white;
-                border-radius: 10px;
-                padding: 20px;
-                border: 1px solid #e0e0e0;
-            }
-            QTextEdit {
-                font-family: Consolas, Monaco, monospace;
-                font-size: 12px;
-                padding: 8px;
-                background-color: white;
-                color: #333333;
-                border: 1px solid #d0d0d0;
-                border-radius: 6px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #d0d0d0;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 10px;
-                color: #333333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #d0d0d0;
-                border-radius: 6px;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                color: #333333;
-                padding: 8px 12px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4d8bf0;
-                color: white;
-                font-weight: bold;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: #f0f0f0;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #c0c0c0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #a0a0a0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-        
     def init_ui(self):
         """初始化用户界面"""
         # 创建中央部件
@@ -305,30 +641,31 @@ class MainWindow(QMainWindow):
         self.menu_list.setFixedWidth(180)
         self.menu_list.setIconSize(QSize(24, 24))
         
-        # 添加菜单项
-        menu_items = [
-            {"name": "主页", "icon": "home"},
-            {"name": "设置", "icon": "settings"},
-            {"name": "日志", "icon": "log"},
-            {"name": "关于", "icon": "about"}
-        ]
-        
-        for item in menu_items:
-            list_item = QListWidgetItem(item["name"])
-            self.menu_list.addItem(list_item)
-        
+        # 批量添加菜单项，单次插入即可完成布局计算
+        self.menu_list.setUniformItemSizes(True)
+        self.menu_list.addItems([name for name, _ in MENU_ITEMS])
+
         self.menu_list.setCurrentRow(0)
         self.menu_list.currentRowChanged.connect(self.change_page)
         
         # 右侧内容区域
         self.content_stack = QStackedWidget()
-        
-        # 创建各个页面
+
+        # 页面构建函数表，主页立即创建，其余页面首次访问时再构建
+        self._page_builders = {
+            1: self.create_settings_page,
+            2: self.create_log_page,
+            3: self.create_about_page,
+        }
+        self._page_built = {0}
+
+        # 创建主页
         self.create_home_page()
-        self.create_settings_page()
-        self.create_log_page()
-        self.create_about_page()
-        
+
+        # 其余页面先放空白占位控件，省去启动时构建整套控件和解析关于页HTML
+        for _ in self._page_builders:
+            self.content_stack.addWidget(QWidget())
+
         # 添加到主布局
         main_layout.addWidget(self.menu_list)
         main_layout.addWidget(self.content_stack)
@@ -349,7 +686,7 @@ class MainWindow(QMainWindow):
         # 标题
         title_label = QLabel("微信收藏解析工具")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 26px; font-weight: bold; color: #4d8bf0; margin-bottom: 5px;")
+        title_label.setObjectName("homeTitle")
         content_layout.addWidget(title_label)
         
         # 创建主区域（预览和进度）
@@ -361,12 +698,12 @@ class MainWindow(QMainWindow):
         # 预览区域标题
         preview_title = QHBoxLayout()
         preview_label = QLabel("文件预览")
-        preview_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #333333;")
+        preview_label.setObjectName("sectionLabel")
         preview_title.addWidget(preview_label)
         
         # 添加排序说明标签
         self.sort_info_label = QLabel("排序: 等待解析...")
-        self.sort_info_label.setStyleSheet("font-size: 12px; color: #666666; margin-left: 10px;")
+        self.sort_info_label.setObjectName("sortInfoLabel")
         preview_title.addWidget(self.sort_info_label)
         
         preview_title.addStretch()
@@ -375,23 +712,7 @@ class MainWindow(QMainWindow):
         sort_by_time_btn = QPushButton("按时间排序")
         sort_by_time_btn.setFixedWidth(100)
         sort_by_time_btn.clicked.connect(self.sort_by_time)
-        sort_by_time_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5cb85c;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                font-size: 12px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4cae4c;
-            }
-            QPushButton:pressed {
-                background-color: #3c8b3c;
-            }
-        """)
+        sort_by_time_btn.setObjectName("smallGreenBtn")
         preview_title.addWidget(sort_by_time_btn)
         
         # 始终显示清除缓存按钮，不管是否设置了自动清除缓存
@@ -405,49 +726,37 @@ class MainWindow(QMainWindow):
         # 预览区域（带边框）
         preview_frame = QFrame()
         preview_frame.setFrameShape(QFrame.StyledPanel)
-        preview_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: white;
-            }
-        """)
+        preview_frame.setObjectName("previewFrame")
         preview_layout = QVBoxLayout(preview_frame)
         preview_layout.setContentsMargins(5, 5, 5, 5)  # 减少内边距
         
         # 使用QListWidget显示图片预览
-        self.preview_list = QListWidget()
+        # 预览区走模型/视图：QListView配合Batched布局按批增量排版，
+        # 大量文件时不会一次性计算全部项的位置
+        self.preview_list = QListView()
+        self.preview_model = QStandardItemModel(self)
+        self.preview_list.setModel(self.preview_model)
         self.preview_list.setMinimumHeight(300)
         self.preview_list.setIconSize(QSize(130, 130))  # 减小图标尺寸
-        self.preview_list.setResizeMode(QListWidget.Adjust)
-        self.preview_list.setViewMode(QListWidget.IconMode)  # 使用图标模式
-        self.preview_list.setMovement(QListWidget.Static)  # 禁止拖动
+        self.preview_list.setResizeMode(QListView.Adjust)
+        self.preview_list.setViewMode(QListView.IconMode)  # 使用图标模式
+        self.preview_list.setMovement(QListView.Static)  # 禁止拖动
         self.preview_list.setWrapping(True)  # 允许换行
         self.preview_list.setSpacing(10)  # 减少图标间距
-        self.preview_list.setStyleSheet("""
-            QListWidget {
-                border: none;
-                background-color: white;
-                padding: 2px;
-            }
-            QListWidget::item {
-                background-color: #f9f9f9;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 5px;
-                margin: 5px;
-                color: black;
-            }
-            QListWidget::item:hover {
-                background-color: #f0f0f0;
-                border: 1px solid #d0d0d0;
-            }
-            QListWidget::item:selected {
-                background-color: #e5f1fb;
-                border: 1px solid #99c9ef;
-            }
-        """)
-        
+        self.preview_list.setUniformItemSizes(True)  # 所有项尺寸一致，布局可走快路径
+        self.preview_list.setLayoutMode(QListView.Batched)
+        self.preview_list.setBatchSize(50)
+        self.preview_list.setEditTriggers(QListView.NoEditTriggers)
+        self.preview_list.setObjectName("previewList")
+
+        # 滚动停稳后再调度可见区域的缩略图解码，50ms去抖合并连续滚动事件
+        self._thumb_schedule_timer = QTimer(self)
+        self._thumb_schedule_timer.setSingleShot(True)
+        self._thumb_schedule_timer.setInterval(50)
+        self._thumb_schedule_timer.timeout.connect(self._schedule_visible_thumbnails)
+        self.preview_list.verticalScrollBar().valueChanged.connect(
+            lambda _: self._thumb_schedule_timer.start())
+
         preview_layout.addWidget(self.preview_list)
         main_layout.addWidget(preview_frame, 10)  # 增加权重，使预览区域占据更多空间
         
@@ -462,25 +771,12 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.progress_bar.setMinimumHeight(15)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 6px;
-                background-color: #e8e8e8;
-                text-align: center;
-                color: #333333;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #4d8bf0;
-                border-radius: 6px;
-            }
-        """)
+        self.progress_bar.setObjectName("mainProgressBar")
         progress_layout.addWidget(self.progress_bar)
         
         self.status_label = QLabel("准备就绪")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: #4d8bf0; font-size: 14px;")
+        self.status_label.setObjectName("statusLabel")
         progress_layout.addWidget(self.status_label)
         
         main_layout.addWidget(progress_widget, 1)  # 设置较小的权重
@@ -503,28 +799,7 @@ class MainWindow(QMainWindow):
         self.archive_btn.setMinimumHeight(35)
         self.archive_btn.setFixedWidth(150)
         self.archive_btn.clicked.connect(self.select_archive)
-        self.archive_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5cb85c;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                min-height: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4cae4c;
-            }
-            QPushButton:pressed {
-                background-color: #3c8b3c;
-            }
-            QPushButton:disabled {
-                background-color: #b0b0b0;
-                color: #e0e0e0;
-            }
-        """)
+        self.archive_btn.setObjectName("greenBtn")
         
         # 保存按钮
         self.save_btn = QPushButton("保存文件")
@@ -559,7 +834,7 @@ class MainWindow(QMainWindow):
         # 标题
         title_label = QLabel("设置")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #4d8bf0; margin: 30px 0;")
+        title_label.setObjectName("pageTitle")
         content_layout.addWidget(title_label)
         
         # 添加一些空间
@@ -567,7 +842,7 @@ class MainWindow(QMainWindow):
         
         # 微信缓存路径设置
         cache_group = QGroupBox("微信缓存路径")
-        cache_group.setStyleSheet("QGroupBox { font-size: 16px; margin-top: 30px; }")
+        cache_group.setObjectName("settingsGroup")
         cache_layout = QVBoxLayout(cache_group)
         cache_layout.setContentsMargins(0, 0, 0, 10)
         cache_layout.setAlignment(Qt.AlignCenter)
@@ -594,65 +869,37 @@ class MainWindow(QMainWindow):
         auto_detect_btn.setMinimumHeight(35)
         auto_detect_btn.setFixedWidth(100)
         auto_detect_btn.clicked.connect(self.auto_detect_and_fill)
-        auto_detect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5cb85c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4cae4c;
-            }
-            QPushButton:pressed {
-                background-color: #3c8b3c;
-            }
-        """)
+        auto_detect_btn.setObjectName("autoDetectBtn")
         
         cache_input_layout.addWidget(self.cache_path_edit)
         cache_input_layout.addWidget(cache_btn)
         cache_input_layout.addWidget(auto_detect_btn)
         
-        # 添加到主布局并居中
-        cache_center_layout = QHBoxLayout()
-        cache_center_layout.addStretch()
-        cache_center_layout.addLayout(cache_input_layout)
-        cache_center_layout.addStretch()
-        
         # 显示当前登录的微信ID
         wxid_layout = QHBoxLayout()
         wxid_label = QLabel("当前登录的微信ID:")
-        wxid_label.setStyleSheet("color: #666666; font-size: 12px;")
+        wxid_label.setObjectName("hintLabel")
         
         self.wxid_value = QLabel()
-        self.wxid_value.setStyleSheet("color: #333333; font-size: 12px; font-weight: bold;")
+        self.wxid_value.setObjectName("hintValue")
         
-        # 尝试获取并显示当前登录的wxid
-        try:
-            wxid = WeChatParser.get_current_wxid()
-            if wxid:
-                self.wxid_value.setText(wxid)
-            else:
-                self.wxid_value.setText("未检测到")
-        except Exception as e:
-            self.wxid_value.setText("检测失败")
-            logger.error(f"获取wxid失败: {str(e)}")
+        # 页面构建完成后再检测wxid，结果由_cached_wxid缓存，重建页面不会重复扫描
+        self.wxid_value.setText("检测中...")
+        QTimer.singleShot(0, self._fill_wxid_value)
         
-        wxid_layout.addStretch()
         wxid_layout.addWidget(wxid_label)
         wxid_layout.addWidget(self.wxid_value)
-        wxid_layout.addStretch()
-        
-        cache_layout.addLayout(cache_center_layout)
+
+        # 通过对齐方式居中，省去成对的伸缩占位项
+        cache_layout.addLayout(cache_input_layout)
+        cache_layout.setAlignment(cache_input_layout, Qt.AlignHCenter)
         cache_layout.addLayout(wxid_layout)
+        cache_layout.setAlignment(wxid_layout, Qt.AlignHCenter)
         content_layout.addWidget(cache_group)
         
         # 输出保存路径设置
         output_group = QGroupBox("输出保存路径")
-        output_group.setStyleSheet("QGroupBox { font-size: 16px; margin-top: 30px; }")
+        output_group.setObjectName("settingsGroup")
         output_layout = QVBoxLayout(output_group)
         output_layout.setContentsMargins(0, 0, 0, 10)
         output_layout.setAlignment(Qt.AlignCenter)
@@ -678,17 +925,13 @@ class MainWindow(QMainWindow):
         output_input_layout.addWidget(output_btn)
         
         # 添加到主布局并居中
-        output_center_layout = QHBoxLayout()
-        output_center_layout.addStretch()
-        output_center_layout.addLayout(output_input_layout)
-        output_center_layout.addStretch()
-        
-        output_layout.addLayout(output_center_layout)
+        output_layout.addLayout(output_input_layout)
+        output_layout.setAlignment(output_input_layout, Qt.AlignHCenter)
         content_layout.addWidget(output_group)
         
         # 缓存设置
         cache_settings_group = QGroupBox("缓存设置")
-        cache_settings_group.setStyleSheet("QGroupBox { font-size: 16px; margin-top: 30px; }")
+        cache_settings_group.setObjectName("settingsGroup")
         cache_settings_layout = QVBoxLayout(cache_settings_group)
         cache_settings_layout.setContentsMargins(0, 0, 0, 10)
         cache_settings_layout.setAlignment(Qt.AlignCenter)
@@ -700,32 +943,20 @@ class MainWindow(QMainWindow):
 
         # 创建复选框
         self.auto_clear_checkbox = QCheckBox("保存文件后自动清除缓存")
-        self.auto_clear_checkbox.setStyleSheet("font-size: 14px;")
+        self.auto_clear_checkbox.setObjectName("autoClearCheck")
         self.auto_clear_checkbox.setMinimumHeight(35)  # 与其他输入框保持一致的高度
         self.auto_clear_checkbox.setChecked(self.config.get("auto_clear_cache", False))
 
         cache_settings_input_layout.addWidget(self.auto_clear_checkbox)
-        cache_settings_input_layout.addStretch()
-
-        # 添加到主布局并居中
-        cache_settings_center_layout = QHBoxLayout()
-        cache_settings_center_layout.addStretch()
-        cache_settings_center_layout.addLayout(cache_settings_input_layout)
-        cache_settings_center_layout.addStretch()
 
         # 添加描述文本
         cache_settings_desc = QLabel("开启后，每次保存文件完成将自动清除微信缓存文件并清空预览列表")
-        cache_settings_desc.setStyleSheet("color: #666666; font-size: 12px;")
+        cache_settings_desc.setObjectName("hintLabel")
         cache_settings_desc.setAlignment(Qt.AlignCenter)
 
-        # 描述文本居中布局
-        desc_center_layout = QHBoxLayout()
-        desc_center_layout.addStretch()
-        desc_center_layout.addWidget(cache_settings_desc)
-        desc_center_layout.addStretch()
-
-        cache_settings_layout.addLayout(cache_settings_center_layout)
-        cache_settings_layout.addLayout(desc_center_layout)
+        cache_settings_layout.addLayout(cache_settings_input_layout)
+        cache_settings_layout.setAlignment(cache_settings_input_layout, Qt.AlignHCenter)
+        cache_settings_layout.addWidget(cache_settings_desc, 0, Qt.AlignHCenter)
         content_layout.addWidget(cache_settings_group)
         
         # 添加一些空间
@@ -736,18 +967,33 @@ class MainWindow(QMainWindow):
         save_btn.setMinimumHeight(50)
         save_btn.setFixedWidth(200)
         save_btn.clicked.connect(self.save_settings)
-        
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        btn_layout.addWidget(save_btn)
-        btn_layout.addStretch()
-        
-        content_layout.addLayout(btn_layout)
+
+        content_layout.addWidget(save_btn, 0, Qt.AlignHCenter)
         content_layout.addStretch()
         
         layout.addWidget(content_frame)
         self.content_stack.addWidget(settings_page)
-        
+
+    def _fill_wxid_value(self):
+        """后台检测并显示当前登录的wxid"""
+        if _cached_wxid.cache_info().currsize:
+            # 本进程已检测过，直接读lru_cache缓存值，不用再进线程池
+            self._wxid_detected(_cached_wxid() or "")
+            return
+
+        signals = WxidSignals(self)
+        signals.detected.connect(self._wxid_detected)
+        self._wxid_signals = signals  # 保持引用，避免信号对象被提前回收
+        self._thumb_pool.start(WxidDetectWorker(signals))
+
+    def _wxid_detected(self, wxid):
+        """wxid检测完成后刷新标签"""
+        try:
+            self.wxid_value.setText(wxid if wxid else "未检测到")
+        except RuntimeError:
+            # 页面已被销毁重建，忽略过期的检测结果
+            pass
+
     def create_log_page(self):
         """创建日志页面"""
         log_page = QWidget()
@@ -764,20 +1010,23 @@ class MainWindow(QMainWindow):
         # 标题
         title_label = QLabel("运行日志")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #4d8bf0; margin: 30px 0;")
+        title_label.setObjectName("pageTitle")
         content_layout.addWidget(title_label)
         
         # 添加一些空间
         content_layout.addSpacing(30)
         
         # 日志显示区域
-        self.log_text = QTextEdit()
+        # 纯文本日志用QPlainTextEdit，行级布局比QTextEdit的富文本引擎快得多
+        self.log_text = QPlainTextEdit()
         self.log_text.setMinimumHeight(350)
         content_layout.addWidget(self.log_text)
         
         # 设置日志处理器
         self.log_handler = QTextEditLogger(self.log_text)
         self.log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # 先把日志页构建之前攒下的启动期日志补进缓冲区，再接管后续日志
+        self.log_handler._buffer.extend(_startup_log_buffer.drain())
         logging.getLogger().addHandler(self.log_handler)
         
         # 添加一些空间
@@ -814,165 +1063,50 @@ class MainWindow(QMainWindow):
         # 标题
         title_label = QLabel("关于")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #4d8bf0;")
+        title_label.setObjectName("aboutTitle")
         content_layout.addWidget(title_label)
         
         # 添加一些空间
         content_layout.addSpacing(20)
         
-        # 关于文本
-        about_text = """
-        <h2 style="color: #333333; text-align: center;">微信收藏解析工具</h2>
-        <p style="font-size: 16px; line-height: 1.6; color: #333333; text-align: center;">
-        一款简单易用的工具，帮助ymh摸鱼
-        </p>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">软件特点</h3>
-        <ul style="font-size: 15px; line-height: 1.6; color: #333333;">
-            <li><b>自动检测</b> - 智能识别当前登录微信用户的收藏路径</li>
-            <li><b>批量解析</b> - 一键解析微信收藏中的图片和视频资源</li>
-            <li><b>压缩包解析</b> - 支持解析ZIP压缩包中的图片和视频</li>
-            <li><b>智能排序</b> - 尽可能保持与微信收藏笔记中相同的图片顺序</li>
-            <li><b>预览功能</b> - 直观展示解析出的文件，方便筛选</li>
-            <li><b>手动排序</b> - 支持按时间重新排序，调整文件顺序</li>
-            <li><b>自定义保存</b> - 可自定义保存路径和文件夹名称</li>
-            <li><b>缓存管理</b> - 可选择是否在保存后自动清除缓存</li>
-            <li><b>日志记录</b> - 详细记录运行过程，便于排查问题</li>
-        </ul>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">使用步骤</h3>
-        <ol style="font-size: 15px; line-height: 1.6; color: #333333;">
-            <li><b>解析微信收藏</b>：</li>
-            <ul style="font-size: 14px; line-height: 1.5; margin-left: 20px; margin-bottom: 15px;">
-                <li>在<b>设置</b>页面配置微信缓存路径（可点击"自动检测"按钮）</li>
-                <li>设置输出保存路径，选择文件保存的位置</li>
-                <li>选择是否在保存后自动清除缓存</li>
-                <li>保存设置后，返回<b>主页</b></li>
-                <li>点击"解析微信缓存"按钮，解析缓存中的文件</li>
-            </ul>
-            <li><b>解析压缩包</b>：</li>
-            <ul style="font-size: 14px; line-height: 1.5; margin-left: 20px; margin-bottom: 15px;">
-                <li>点击"选择压缩包"按钮，选择要解析的ZIP压缩包</li>
-                <li>程序会自动解压并解析压缩包中的图片和视频文件</li>
-            </ul>
-            <li><b>保存文件</b>：</li>
-            <ul style="font-size: 14px; line-height: 1.5; margin-left: 20px; margin-bottom: 15px;">
-                <li>在预览列表中查看解析出的文件</li>
-                <li>点击"保存文件"按钮将文件保存到指定位置</li>
-                <li>输入自定义文件夹名称（留空则自动使用数字命名）</li>
-                <li>等待保存完成</li>
-                <li>如需清除缓存，可点击"清除缓存"按钮</li>
-            </ul>
-        </ol>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">🎯 图片排序功能</h3>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333;">
-        为了解决图片顺序与微信收藏笔记不一致的问题，软件实现了智能排序功能：
-        </p>
-        
-        <h4 style="color: #5cb85c; margin-top: 15px; margin-bottom: 10px;">排序策略（按优先级）</h4>
-        <ul style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-            <li><b style="color: #5cb85c;">数据库排序（最佳）</b> - 从微信数据库获取原始顺序信息，最接近收藏笔记顺序</li>
-            <li><b style="color: #f0ad4e;">时间排序（良好）</b> - 基于文件修改时间排序，通常反映添加到收藏的顺序</li>
-            <li><b style="color: #d9534f;">默认排序（一般）</b> - 使用文件系统默认遍历顺序</li>
-        </ul>
-        
-        <h4 style="color: #5cb85c; margin-top: 15px; margin-bottom: 10px;">使用方法</h4>
-        <ol style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-            <li>解析完成后，查看预览区域的排序状态标签</li>
-            <li>绿色表示最佳排序，橙色表示良好排序，红色表示一般排序</li>
-            <li>如果排序效果不理想，可点击"按时间排序"按钮手动调整</li>
-            <li>保存文件时会保持当前的排序顺序</li>
-        </ol>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">常见问题</h3>
-        <p style="font-size: 15px; font-weight: bold; color: #333333;">1. 如何找到微信缓存路径？</p>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-        点击"自动检测"按钮，软件会自动查找当前登录微信用户的收藏路径。<br>
-        如果自动检测失败，通常可以在以下位置找到：<br>
-        - C:\\Users\\用户名\\Documents\\WeChat Files\\微信号\\FileStorage\\Favorites<br>
-        - C:\\Users\\用户名\\Documents\\WeChat Files\\微信号\\FileStorage\\Fav
-        </p>
-        
-        <p style="font-size: 15px; font-weight: bold; color: #333333;">2. 支持哪些压缩包格式？</p>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-        目前支持的压缩包格式为：<br>
-        - ZIP (.zip)<br>
-        如需解析其他格式的压缩包，请先将其转换为ZIP格式。
-        </p>
-        
-        <p style="font-size: 15px; font-weight: bold; color: #333333;">3. 图片顺序是如何确定的？</p>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-        软件会尝试多种方式来保持与微信收藏笔记中相同的图片顺序：<br>
-        - <b style="color: #5cb85c;">数据库排序（最佳）</b>：从微信数据库中获取原始顺序信息<br>
-        - <b style="color: #f0ad4e;">时间排序（良好）</b>：按文件修改时间排序，通常反映添加到收藏的顺序<br>
-        - <b style="color: #d9534f;">默认排序（一般）</b>：按文件系统顺序排列<br>
-        解析完成后，状态栏会显示当前使用的排序方式。如果顺序不理想，可以点击"按时间排序"按钮重新排序。
-        </p>
-        
-        <p style="font-size: 15px; font-weight: bold; color: #333333;">4. 为什么有些文件无法解析？</p>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-        目前支持解析的文件类型包括：jpg、jpeg、png、gif、bmp、webp、mp4、mov、avi、mkv、wmv、flv。<br>
-        其他类型的文件可能无法正确解析和预览。
-        </p>
-        
-        <p style="font-size: 15px; font-weight: bold; color: #333333;">5. 清除缓存会删除哪些文件？</p>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333; margin-left: 20px;">
-        清除缓存只会删除微信缓存路径下的图片和视频文件，不会影响微信的正常使用。<br>
-        建议在确认文件已成功保存后再清除缓存。
-        </p>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">技术支持</h3>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333;">
-        如果您在使用过程中遇到任何问题，可以查看<b>日志</b>页面获取详细信息，或联系开发者获取支持。
-        </p>
-        
-        <h3 style="color: #4d8bf0; margin-top: 25px;">更新日志</h3>
-        <p style="font-size: 14px; line-height: 1.5; color: #333333;">
-        <b>v1.3.0 (2025年8月)</b><br>
-        ✨ 新增压缩包解析功能，支持ZIP格式<br>
-        ✨ 优化界面布局，改进按钮命名和位置<br>
-        🔧 改进文件保存逻辑，更好地处理压缩包中的文件<br>
-        🐛 修复多个稳定性问题<br>
-        </p>
-        
-        <p style="font-size: 14px; line-height: 1.5; color: #333333;">
-        <b>v1.2.0 (2025年7月)</b><br>
-        ✨ 新增智能图片排序功能，尽可能保持与微信收藏笔记中相同的顺序<br>
-        ✨ 新增手动排序功能，支持按时间重新排序<br>
-        ✨ 新增排序状态显示，实时反馈当前排序策略<br>
-        🔧 优化数据库查询，支持多种排序字段<br>
-        🔧 改进文件系统排序，基于修改时间精确排序<br>
-        📝 完善日志记录，详细显示排序过程信息
-        </p>
-        
-        <p style="font-size: 14px; line-height: 1.6; color: #333333; margin-top: 30px; text-align: center;">
-        版本：1.3.0<br>
-        开发者：小新<br>
-        最后更新：2025年8月
-        </p>
-        """
-        
-        # 使用QTextEdit显示关于文本
-        about_textEdit = QTextEdit()
-        about_textEdit.setHtml(about_text)
-        about_textEdit.setReadOnly(True)
-        about_textEdit.setStyleSheet("border: none; background-color: transparent;")
-        
+        # 关于文本由外部HTML文件提供，QTextBrowser按需加载，
+        # 避免大段HTML字符串常驻Python内存
+        about_browser = QTextBrowser()
+        about_browser.setOpenExternalLinks(True)
+        # 只读视图不需要撤销栈
+        about_browser.setUndoRedoEnabled(False)
+        about_browser.setSource(QUrl.fromLocalFile(ABOUT_HTML_FILE))
+        about_browser.setObjectName("aboutText")
+
         # 设置更大的高度以显示更多内容
-        about_textEdit.setMinimumHeight(500)
-        
-        # 滚动到顶部
-        about_textEdit.moveCursor(QTextCursor.Start)
-        
-        content_layout.addWidget(about_textEdit)
+        about_browser.setMinimumHeight(500)
+
+        content_layout.addWidget(about_browser)
         
         layout.addWidget(content_frame)
         self.content_stack.addWidget(about_page)
     
     def change_page(self, index):
         """切换页面"""
+        if index not in self._page_built:
+            self._build_page(index)
         self.content_stack.setCurrentIndex(index)
+
+    def _build_page(self, index):
+        """首次访问时构建页面并替换占位控件"""
+        builder = self._page_builders.get(index)
+        if builder is None:
+            return
+
+        placeholder = self.content_stack.widget(index)
+        # create_*_page 会把新页面追加到栈尾，移到正确的位置上
+        builder()
+        page = self.content_stack.widget(self.content_stack.count() - 1)
+        self.content_stack.removeWidget(page)
+        self.content_stack.insertWidget(index, page)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._page_built.add(index)
         
     def select_cache_path(self):
         """选择微信缓存路径"""
@@ -1027,9 +1161,10 @@ class MainWindow(QMainWindow):
             CustomMessageBox.critical(self, "错误", f"微信缓存路径不存在: {cache_path}")
             return
         
-        # 清空预览列表
-        self.preview_list.clear()
-        
+        # 清空预览列表（包括还未刷入模型的排队条目）
+        self._pending_previews.clear()
+        self.preview_model.clear()
+
         # 禁用按钮，防止重复点击
         self.parse_btn.setEnabled(False)
         self.save_btn.setEnabled(False)
@@ -1039,7 +1174,7 @@ class MainWindow(QMainWindow):
         # 重置进度条和排序信息
         self.progress_bar.setValue(0)
         self.sort_info_label.setText("排序: 等待解析...")
-        self.sort_info_label.setStyleSheet("font-size: 12px; color: #666666; margin-left: 10px;")
+        self._set_sort_tier("default")
         
         # 创建解析线程
         self.parser_thread = ParserThread(cache_path, None, preview_only=True)
@@ -1057,36 +1192,30 @@ class MainWindow(QMainWindow):
     
     def parsing_finished(self):
         """解析完成"""
+        # 把还在队列里的条目刷进模型，保证计数准确
+        self._flush_preview_queue()
         self.parse_btn.setEnabled(True)
         # 如果有文件被解析，启用保存按钮
-        if self.preview_list.count() > 0:
+        if self.preview_model.rowCount() > 0:
             self.save_btn.setEnabled(True)
             
-            # 获取排序策略信息
-            try:
-                cache_path = self.config.get("cache_path", "")
-                if cache_path:
-                    parser = WeChatParser(cache_path)
-                    sort_info = parser.get_sorting_strategy_info()
-                    self.status_label.setText(f"解析完成，找到 {self.preview_list.count()} 个文件")
-                    
-                    # 更新排序信息标签
-                    if "数据库排序" in sort_info:
-                        self.sort_info_label.setText("排序: 数据库顺序（最佳）")
-                        self.sort_info_label.setStyleSheet("font-size: 12px; color: #5cb85c; margin-left: 10px; font-weight: bold;")
-                    elif "时间排序" in sort_info:
-                        self.sort_info_label.setText("排序: 时间顺序（良好）")
-                        self.sort_info_label.setStyleSheet("font-size: 12px; color: #f0ad4e; margin-left: 10px; font-weight: bold;")
-                    else:
-                        self.sort_info_label.setText("排序: 默认顺序（一般）")
-                        self.sort_info_label.setStyleSheet("font-size: 12px; color: #d9534f; margin-left: 10px; font-weight: bold;")
-                else:
-                    self.status_label.setText(f"解析完成，找到 {self.preview_list.count()} 个文件")
-                    self.sort_info_label.setText("排序: 未知")
-            except Exception as e:
-                logger.warning(f"获取排序信息失败: {str(e)}")
-                self.status_label.setText(f"解析完成，找到 {self.preview_list.count()} 个文件")
+            # 排序策略解析线程已算好，这里只读属性，不再新建解析器
+            sort_info = getattr(self.parser_thread, 'sort_strategy', None) \
+                if hasattr(self, 'parser_thread') else None
+            self.status_label.setText(f"解析完成，找到 {self.preview_model.rowCount()} 个文件")
+
+            # 更新排序信息标签
+            if not sort_info:
                 self.sort_info_label.setText("排序: 未知")
+            elif "数据库排序" in sort_info:
+                self.sort_info_label.setText("排序: 数据库顺序（最佳）")
+                self._set_sort_tier("best")
+            elif "时间排序" in sort_info:
+                self.sort_info_label.setText("排序: 时间顺序（良好）")
+                self._set_sort_tier("good")
+            else:
+                self.sort_info_label.setText("排序: 默认顺序（一般）")
+                self._set_sort_tier("fallback")
         else:
             self.status_label.setText("解析完成，未找到文件")
             self.sort_info_label.setText("排序: 无文件")
@@ -1104,8 +1233,9 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'save_thread') and hasattr(self.save_thread, 'save_folder'):
                 save_path = self.save_thread.save_folder
                 if os.path.exists(save_path):
-                    # 获取保存文件夹中的文件数量
-                    file_count = len([name for name in os.listdir(save_path) if os.path.isfile(os.path.join(save_path, name))])
+                    # 获取保存文件夹中的文件数量，scandir的目录项自带类型信息
+                    with os.scandir(save_path) as entries:
+                        file_count = sum(1 for entry in entries if entry.is_file())
                     success_msg = f"文件已保存到: {save_path}\n共保存了 {file_count} 个文件"
                     CustomMessageBox.information(self, "完成", success_msg)
                     logger.info(f"保存完成，位置: {save_path}，文件数: {file_count}")
@@ -1127,86 +1257,123 @@ class MainWindow(QMainWindow):
             self.clear_temp_archives()
     
     def add_file_to_preview(self, file_info):
-        """将文件添加到预览列表，显示图片预览"""
+        """将文件添加到预览列表，图片缩略图由后台线程解码"""
         try:
             # 创建一个列表项
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, file_info)  # 存储文件信息
-            
-            # 根据文件类型加载预览
+            item = QStandardItem()
+            item.setData(file_info, Qt.UserRole)  # 存储文件信息
+
+            # 根据文件类型加载预览（rpartition取后缀，单次C级操作）
             file_path = file_info['path']
             file_name = file_info['name']
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # 图片文件预览
-            if file_ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']:
-                try:
-                    # 使用多种方法尝试加载图片
-                    pixmap = None
-                    
-                    # 方法1: 直接使用QPixmap加载
-                    pixmap = QPixmap(file_path)
-                    if pixmap.isNull():
-                        # 方法2: 使用QImage加载
-                        image = QImage(file_path)
-                        if not image.isNull():
-                            pixmap = QPixmap.fromImage(image)
-                    
-                    # 如果仍然无法加载，尝试读取文件内容后加载
-                    if pixmap is None or pixmap.isNull():
-                        try:
-                            # 方法3: 读取文件内容后加载
-                            with open(file_path, 'rb') as f:
-                                image_data = f.read()
-                                image = QImage()
-                                if image.loadFromData(image_data):
-                                    pixmap = QPixmap.fromImage(image)
-                        except Exception as e:
-                            logger.error(f"无法通过文件内容加载图片: {str(e)}")
-                    
-                    # 如果成功加载了图片
-                    if pixmap and not pixmap.isNull():
-                        pixmap = pixmap.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        item.setIcon(QIcon(pixmap))
-                        item.setText(file_name)
-                        logger.info(f"成功加载图片预览: {file_name}")
-                    else:
-                        # 所有方法都失败，使用默认文本
-                        item.setText(f"{file_name}\n[图片加载失败]")
-                        logger.warning(f"无法加载图片预览: {file_path}")
-                except Exception as e:
-                    # 捕获任何加载图片时的异常
-                    item.setText(f"{file_name}\n[图片]")
-                    logger.error(f"加载图片预览时出错: {str(e)}")
+            file_ext = file_path.rpartition('.')[2].lower()
+
+            # 图片文件预览：先用占位文本入列，路径暂存在条目上，
+            # 滚动到可见区域时才交给线程池解码
+            if file_ext in IMAGE_EXTS:
+                item.setText(f"{file_name}\n[加载中...]")
+                item.setData(file_path, THUMB_PENDING_ROLE)
             # 视频文件预览
-            elif file_ext in ['.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv']:
+            elif file_ext in VIDEO_EXTS:
                 item.setText(f"{file_name}\n[视频]")
+                item.setIcon(_badge_icon("视频", "#4d8bf0"))
             # 其他文件预览
             else:
                 item.setText(f"{file_name}\n[文件]")
-            
+                item.setIcon(_badge_icon("文件", "#888888"))
+
             # 设置文本对齐
             item.setTextAlignment(Qt.AlignCenter)
             # 设置项目大小 - 为图片和文本预留足够空间
             item.setSizeHint(QSize(190, 210))
-            
-            # 添加到列表
-            self.preview_list.addItem(item)
-            
+
+            # 入待刷新队列，批量插入避免每个文件都触发一次布局
+            self._queue_preview_item(item)
+
         except Exception as e:
             logger.error(f"添加预览时出错: {str(e)}")
             # 如果出错，仍然添加一个简单的项目
             try:
-                simple_item = QListWidgetItem(file_info['name'])
-                simple_item.setData(Qt.UserRole, file_info)
-                self.preview_list.addItem(simple_item)
+                simple_item = QStandardItem(file_info['name'])
+                simple_item.setData(file_info, Qt.UserRole)
+                self._queue_preview_item(simple_item)
             except Exception as e2:
                 logger.error(f"添加简单预览也失败: {str(e2)}")
-    
+
+    def _queue_preview_item(self, item):
+        """把预览条目放入待刷新队列并确保定时器在跑"""
+        self._pending_previews.append(item)
+        if not self._preview_flush_timer.isActive():
+            self._preview_flush_timer.start()
+
+    def _flush_preview_queue(self):
+        """把排队的预览条目批量刷入模型"""
+        if not self._pending_previews:
+            self._preview_flush_timer.stop()
+            return
+        items = self._pending_previews
+        self._pending_previews = []
+        self.preview_list.setUpdatesEnabled(False)
+        try:
+            for item in items:
+                self.preview_model.appendRow(item)
+        finally:
+            self.preview_list.setUpdatesEnabled(True)
+        # 新条目可能落在可见区域，触发一次可见范围的缩略图调度
+        self._thumb_schedule_timer.start()
+
+    def _schedule_visible_thumbnails(self):
+        """只为可见区域（外加前后各一屏的预取）派发缩略图解码任务
+
+        解码开销从O(条目总数)降到O(可见数)，上千个文件的预览
+        也只解码用户实际滚动到的部分
+        """
+        model = self.preview_model
+        if model.rowCount() == 0:
+            return
+        rect = self.preview_list.viewport().rect()
+        first = self.preview_list.indexAt(rect.topLeft()).row()
+        last = self.preview_list.indexAt(rect.bottomRight()).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = model.rowCount() - 1
+        # 前后各多取一屏，滚动到时缩略图大多已经就绪
+        span = max(last - first + 1, 1)
+        start = max(0, first - span)
+        end = min(model.rowCount() - 1, last + span)
+        for row in range(start, end + 1):
+            item = model.item(row)
+            file_path = item.data(THUMB_PENDING_ROLE)
+            if file_path:
+                item.setData(None, THUMB_PENDING_ROLE)
+                self._thumb_pool.start(ThumbnailLoader(file_path, item, self._thumb_signals))
+
+
+    def _thumbnail_loaded(self, item, image):
+        """后台解码完成，回填缩略图图标（GUI线程执行）"""
+        try:
+            item.setIcon(QIcon(QPixmap.fromImage(image)))
+            file_info = item.data(Qt.UserRole)
+            item.setText(file_info['name'])
+        except RuntimeError:
+            # 预览列表已被清空，条目底层对象已销毁
+            pass
+
+    def _thumbnail_failed(self, item, file_path):
+        """后台解码失败，改为文本占位"""
+        try:
+            file_info = item.data(Qt.UserRole)
+            item.setText(f"{file_info['name']}\n[图片加载失败]")
+            item.setIcon(_badge_icon("图片", "#d9534f"))
+            logger.warning(f"无法加载图片预览: {file_path}")
+        except RuntimeError:
+            pass
+
     def save_parsed_files(self):
         """保存已解析的文件"""
         # 检查是否有文件可供保存
-        if self.preview_list.count() == 0:
+        if self.preview_model.rowCount() == 0:
             CustomMessageBox.information(self, "提示", "没有可保存的文件")
             return
         
@@ -1216,124 +1383,95 @@ class MainWindow(QMainWindow):
             self.menu_list.setCurrentRow(1)  # 切换到设置页面
             return
             
-        # 检查输出路径是否存在
+        # 确保输出路径存在
         logger.info(f"输出路径: {output_path}")
-        logger.info(f"输出路径是否存在: {os.path.exists(output_path)}")
-        logger.info(f"输出路径是否为绝对路径: {os.path.isabs(output_path)}")
-        
-        if not os.path.exists(output_path):
-            try:
-                os.makedirs(output_path)
-                logger.info(f"创建输出路径: {output_path}")
-            except Exception as e:
-                CustomMessageBox.critical(self, "错误", f"无法创建输出路径: {str(e)}")
-                logger.error(f"无法创建输出路径: {str(e)}")
-                return
-        
-        # 获取用户输入的文件夹名称或使用递增数字
-        folder_name, ok = CustomInputDialog.get_text_input(self, "文件夹命名", "请输入保存文件夹名称:")
-        
-        # 用户点击了关闭按钮或取消按钮，直接取消保存操作
-        if not ok:
-            logger.info("用户取消了文件夹命名，取消保存操作")
+        try:
+            os.makedirs(output_path, exist_ok=True)
+        except Exception as e:
+            CustomMessageBox.critical(self, "错误", f"无法创建输出路径: {str(e)}")
+            logger.error(f"无法创建输出路径: {str(e)}")
             return
         
-        # 创建当前日期的文件夹
+        # 当前日期的文件夹路径
         today = datetime.datetime.now().strftime("%Y-%m-%d")
         date_folder = os.path.join(output_path, today)
         logger.info(f"日期文件夹路径: {date_folder}")
-        
-        # 如果用户输入为空，使用自动递增的数字
-        if not folder_name.strip():
-            # 获取现有文件夹中的数字命名文件夹
-            folder_name = self.get_next_folder_number(date_folder)
-            logger.info(f"用户输入为空，将使用自动编号: {folder_name}")
-            
-            # 输出更详细的日志，帮助调试
-            if not os.path.exists(date_folder):
-                logger.info(f"日期文件夹不存在，将创建: {date_folder}")
-            else:
-                existing_folders = [f for f in os.listdir(date_folder) 
-                               if os.path.isdir(os.path.join(date_folder, f))]
-                logger.info(f"日期文件夹已存在，包含以下子文件夹: {existing_folders}")
-        
-        # 确定最终保存路径
-        save_folder = os.path.join(date_folder, folder_name)
-        logger.info(f"最终保存路径: {save_folder}")
-        
-        # 如果文件夹已存在，询问用户
-        if os.path.exists(save_folder):
+
+        # 循环询问命名直到确定可用路径，不再递归调用本方法重走全部检查
+        while True:
+            # 获取用户输入的文件夹名称或使用递增数字
+            folder_name, ok = CustomInputDialog.get_text_input(self, "文件夹命名", "请输入保存文件夹名称:")
+
+            # 用户点击了关闭按钮或取消按钮，直接取消保存操作
+            if not ok:
+                logger.info("用户取消了文件夹命名，取消保存操作")
+                return
+
+            # 如果用户输入为空，使用自动递增的数字
+            if not folder_name.strip():
+                # 获取现有文件夹中的数字命名文件夹
+                folder_name = self.get_next_folder_number(date_folder)
+                logger.info(f"用户输入为空，将使用自动编号: {folder_name}")
+
+                # 输出更详细的日志，帮助调试
+                if not os.path.exists(date_folder):
+                    logger.info(f"日期文件夹不存在，将创建: {date_folder}")
+                else:
+                    existing_folders = [f for f in os.listdir(date_folder)
+                                   if os.path.isdir(os.path.join(date_folder, f))]
+                    logger.info(f"日期文件夹已存在，包含以下子文件夹: {existing_folders}")
+
+            # 确定最终保存路径
+            save_folder = os.path.join(date_folder, folder_name)
+            logger.info(f"最终保存路径: {save_folder}")
+
+            if not os.path.exists(save_folder):
+                break
+
+            # 如果文件夹已存在，询问用户
             reply = CustomMessageBox.question(
-                self, 
-                "文件夹已存在", 
+                self,
+                "文件夹已存在",
                 f"文件夹 '{folder_name}' 已存在。\n是否使用新的名称？"
             )
-            
+
             if reply == CustomMessageBox.Yes:
-                # 用户选择使用新名称，递归调用本方法
-                self.save_parsed_files()
-                return
+                # 用户选择使用新名称，重新输入
+                continue
             elif reply == CustomMessageBox.Cancel:
                 # 用户取消操作
                 return
             # 如果选择No，继续使用已有文件夹
-        
-        # 创建当前日期的文件夹
-        try:
-            if not os.path.exists(date_folder):
-                os.makedirs(date_folder)
-                logger.info(f"创建日期文件夹: {date_folder}")
-        except Exception as e:
-            CustomMessageBox.critical(self, "错误", f"无法创建日期文件夹: {str(e)}")
-            logger.error(f"无法创建日期文件夹: {str(e)}")
-            return
-        
-        # 创建用户命名的文件夹（如果不存在）
+            break
+
+        # 一次makedirs连日期文件夹带命名文件夹一起建好
         try:
-            if not os.path.exists(save_folder):
-                os.makedirs(save_folder)
-                logger.info(f"创建保存文件夹: {save_folder}")
+            os.makedirs(save_folder, exist_ok=True)
         except Exception as e:
             CustomMessageBox.critical(self, "错误", f"无法创建保存文件夹: {str(e)}")
             logger.error(f"无法创建保存文件夹: {str(e)}")
             return
         
-        # 测试保存目录是否可写
-        try:
-            test_file = os.path.join(save_folder, "test_write.txt")
-            with open(test_file, 'w') as f:
-                f.write("Test write permission")
-            
-            if os.path.exists(test_file):
-                os.remove(test_file)
-                logger.info("保存目录写入测试成功")
-            else:
-                logger.error("保存目录写入测试失败")
-                CustomMessageBox.critical(self, "错误", "无法在保存目录创建文件，请检查权限")
-                return
-        except Exception as e:
-            logger.error(f"测试保存目录写入权限失败: {str(e)}")
-            CustomMessageBox.critical(self, "错误", f"测试保存目录写入权限失败: {str(e)}")
+        # 检查保存目录是否可写，不再真写一个测试文件再删掉
+        # （个别网络盘上os.access不可靠，真正失败由保存线程的错误信号兜底）
+        if not os.access(save_folder, os.W_OK):
+            logger.error("保存目录不可写")
+            CustomMessageBox.critical(self, "错误", "无法在保存目录创建文件，请检查权限")
             return
         
-        # 获取所有文件信息
-        files_to_save = []
-        for i in range(self.preview_list.count()):
-            item = self.preview_list.item(i)
-            file_info = item.data(Qt.UserRole)
-            files_to_save.append(file_info)
+        # 获取所有文件信息（列表推导一次建好，省掉逐个append的多次扩容）
+        files_to_save = [self.preview_model.item(i).data(Qt.UserRole)
+                         for i in range(self.preview_model.rowCount())]
         
-        # 检查文件路径是否存在
-        for i, file_info in enumerate(files_to_save[:5]):  # 只检查前5个
-            file_path = file_info['path']
-            logger.info(f"文件{i+1}路径: {file_path}")
-            logger.info(f"文件{i+1}是否存在: {os.path.exists(file_path)}")
-            if os.path.exists(file_path):
+        # 抽查前5个文件，纯诊断用途，DEBUG级别才做stat，省掉正常保存时的元数据调用
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, file_info in enumerate(files_to_save[:5]):
+                file_path = file_info['path']
                 try:
-                    size = os.path.getsize(file_path)
-                    logger.info(f"文件{i+1}大小: {size} 字节")
-                except Exception as e:
-                    logger.error(f"获取文件{i+1}大小失败: {str(e)}")
+                    st = os.stat(file_path)
+                    logger.debug(f"文件{i+1}: {file_path}, 大小: {st.st_size} 字节")
+                except OSError as e:
+                    logger.debug(f"文件{i+1}: {file_path}, 无法访问: {str(e)}")
         
         # 创建保存线程
         try:
@@ -1345,7 +1483,12 @@ class MainWindow(QMainWindow):
                 archive_parser = self.archive_parser_thread.parser
                 logger.info("检测到压缩包解析器，将传递给保存线程")
                 
-            self.save_thread = SaveThread(files_to_save, save_folder, archive_parser)
+            # 同样复用微信解析线程构建的解析器（压缩包场景下为None）
+            wechat_parser = getattr(self.parser_thread, 'parser', None) \
+                if hasattr(self, 'parser_thread') else None
+
+            self.save_thread = SaveThread(files_to_save, save_folder, archive_parser,
+                                          wechat_parser=wechat_parser)
             self.save_thread.progress_updated.connect(self.update_progress)
             self.save_thread.status_updated.connect(self.update_status)
             self.save_thread.error_occurred.connect(self.show_error)
@@ -1365,14 +1508,31 @@ class MainWindow(QMainWindow):
             CustomMessageBox.critical(self, "错误", f"启动保存线程失败: {str(e)}")
             logger.error(f"启动保存线程失败: {str(e)}")
     
+    def _set_sort_tier(self, tier):
+        """切换排序标签的着色状态
+
+        着色规则在全局样式表里按tier属性写好，这里只改属性再polish，
+        不再每次传入内联CSS让Qt重新解析
+        """
+        self.sort_info_label.setProperty("tier", tier)
+        style = self.sort_info_label.style()
+        style.unpolish(self.sort_info_label)
+        style.polish(self.sort_info_label)
+
     def update_progress(self, value):
-        """更新进度条"""
+        """更新进度条（最高约30Hz，贴合屏幕刷新，100%始终放行）"""
+        now = time.monotonic()
+        if value < 100 and now - self._last_progress_ts < 0.033:
+            return
+        self._last_progress_ts = now
         self.progress_bar.setValue(value)
-    
+
     def update_status(self, message):
-        """更新状态信息"""
+        """更新状态信息（重复消息不重复写日志）"""
         self.status_label.setText(message)
-        logger.info(message)
+        if message != self._last_status_msg:
+            self._last_status_msg = message
+            logger.info(message)
     
     def show_error(self, message):
         """显示错误信息"""
@@ -1382,56 +1542,76 @@ class MainWindow(QMainWindow):
         self.save_btn.setEnabled(True)
     
     def load_config(self):
-        """加载配置"""
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    # 使用默认配置补充缺失的配置项
-                    for key, value in DEFAULT_CONFIG.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
-            except Exception as e:
-                logger.error(f"加载配置文件失败: {str(e)}")
+        """加载配置（按文件mtime做内存缓存，文件没变时不重复解析JSON）"""
+        config_file = get_config_path()
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except OSError:
+            return DEFAULT_CONFIG.copy()
+
+        if mtime == _CONFIG_CACHE["mtime"]:
+            return copy.deepcopy(_CONFIG_CACHE["data"])
+
+        try:
+            # 按字节整体读入，orjson可直接处理bytes，省去文本解码
+            with open(config_file, "rb") as f:
+                config = _json_loads(f.read())
+            # 使用默认配置补充缺失的配置项
+            for key, value in DEFAULT_CONFIG.items():
+                if key not in config:
+                    config[key] = value
+            _CONFIG_CACHE["mtime"] = mtime
+            _CONFIG_CACHE["data"] = copy.deepcopy(config)
+            return config
+        except Exception as e:
+            logger.error(f"加载配置文件失败: {str(e)}")
         return DEFAULT_CONFIG.copy()
     
     def save_config(self):
-        """保存配置"""
+        """请求保存配置（去抖后由_flush_config统一写盘）"""
+        self._config_save_timer.start()
+
+    def _flush_config(self):
+        """把配置真正写入磁盘"""
         try:
-            # 确保配置文件目录存在
-            config_dir = os.path.dirname(CONFIG_FILE)
-            if not os.path.exists(config_dir) and config_dir:  # 确保config_dir不为空
-                os.makedirs(config_dir)
-                
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
-            logger.info(f"配置已保存到: {CONFIG_FILE}")
+            # 和上次写盘的内容一致时直接跳过，避免无意义的磁盘写入
+            if self.config == _CONFIG_CACHE["data"]:
+                return
+            config_file = get_config_path()
+            # 确保配置文件目录存在，exist_ok让探测和创建合成一次调用
+            config_dir = os.path.dirname(config_file)
+            if config_dir:  # 确保config_dir不为空
+                os.makedirs(config_dir, exist_ok=True)
+
+            # 先写临时文件再原子替换，避免写入中途崩溃留下半截配置
+            tmp_file = config_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(_json_dumps(self.config))
+            os.replace(tmp_file, config_file)
+            # 同步内存缓存，紧接着的load_config不用重新读盘解析
+            _CONFIG_CACHE["mtime"] = os.stat(config_file).st_mtime_ns
+            _CONFIG_CACHE["data"] = copy.deepcopy(self.config)
+            logger.info(f"配置已保存到: {config_file}")
         except Exception as e:
             logger.error(f"保存配置文件失败: {str(e)}")
             CustomMessageBox.warning(self, "警告", f"保存配置文件失败: {str(e)}")
             
     def get_next_folder_number(self, parent_folder):
         """获取下一个可用的数字文件夹名"""
-        # 确保父文件夹存在
-        if not os.path.exists(parent_folder):
-            os.makedirs(parent_folder)
-            return "1"
-        
-        # 获取所有文件夹
-        folders = [f for f in os.listdir(parent_folder) 
-                  if os.path.isdir(os.path.join(parent_folder, f))]
-        
-        # 筛选出纯数字命名的文件夹
+        # 确保父文件夹存在，单次mkdir代替先探测再创建
+        os.makedirs(parent_folder, exist_ok=True)
+
+        # 用scandir遍历，目录项自带类型信息，不必逐个isdir
         number_folders = []
-        for folder in folders:
-            if folder.isdigit():
-                number_folders.append(int(folder))
-        
+        with os.scandir(parent_folder) as entries:
+            for entry in entries:
+                if entry.name.isdigit() and entry.is_dir():
+                    number_folders.append(int(entry.name))
+
         # 如果没有数字文件夹，返回"1"
         if not number_folders:
             return "1"
-        
+
         # 否则返回最大数字+1
         return str(max(number_folders) + 1)
 
@@ -1473,80 +1653,20 @@ class MainWindow(QMainWindow):
             # 确保选择压缩包按钮可用
             self.archive_btn.setEnabled(True)
             
-            import shutil
-            import glob
-            import tempfile
-            import time
-            import subprocess
-            
             temp_dir = tempfile.gettempdir()
             logger.info(f"清理临时目录中的压缩包缓存: {temp_dir}")
             
-            # 查找匹配模式的目录
-            patterns = ['archive_extract_*', 'safe_archive_*']
-            
-            for pattern in patterns:
-                matching_dirs = glob.glob(os.path.join(temp_dir, pattern))
-                logger.info(f"找到 {len(matching_dirs)} 个匹配 '{pattern}' 的临时目录")
-                
-                for dir_path in matching_dirs:
-                    if os.path.isdir(dir_path):
-                        try:
-                            logger.info(f"尝试删除临时目录: {dir_path}")
-                            
-                            # 尝试关闭所有可能打开的文件句柄
-                            try:
-                                for root, _, files in os.walk(dir_path):
-                                    for file in files:
-                                        file_path = os.path.join(root, file)
-                                        try:
-                                            # 尝试打开并立即关闭文件，释放可能的句柄
-                                            with open(file_path, 'rb'):
-                                                pass
-                                        except:
-                                            pass
-                            except:
-                                pass
-                            
-                            # 第一次尝试删除
-                            shutil.rmtree(dir_path, ignore_errors=True)
-                            
-                            # 检查目录是否还存在
-                            if os.path.exists(dir_path):
-                                logger.warning(f"第一次删除失败，尝试强制删除: {dir_path}")
-                                
-                                # 在Windows上使用rd命令强制删除
-                                if os.name == 'nt':
-                                    try:
-                                        # 使用rd /s /q命令强制删除目录
-                                        subprocess.run(['rd', '/s', '/q', dir_path], 
-                                                      shell=True, 
-                                                      stdout=subprocess.PIPE, 
-                                                      stderr=subprocess.PIPE)
-                                    except:
-                                        pass
-                                
-                                # 等待一小段时间
-                                time.sleep(0.5)
-                                
-                                # 再次尝试Python方式删除
-                                if os.path.exists(dir_path):
-                                    try:
-                                        shutil.rmtree(dir_path, ignore_errors=True)
-                                    except:
-                                        pass
-                                
-                                # 最后检查是否删除成功
-                                if os.path.exists(dir_path):
-                                    logger.error(f"无法删除临时目录，可能被其他进程占用: {dir_path}")
-                                else:
-                                    logger.info(f"临时目录成功删除: {dir_path}")
-                            else:
-                                logger.info(f"临时目录成功删除: {dir_path}")
-                        except Exception as e:
-                            logger.error(f"删除临时目录失败: {dir_path}, 错误: {str(e)}")
-            
-            logger.info("临时目录清理完成")
+            # 一次scandir按前缀找出全部待清理目录，不用按模式各扫一遍
+            prefixes = ('archive_extract_', 'safe_archive_')
+            with os.scandir(temp_dir) as it:
+                matching_dirs = [entry.path for entry in it
+                                 if entry.name.startswith(prefixes)
+                                 and entry.is_dir(follow_symlinks=False)]
+            logger.info(f"找到 {len(matching_dirs)} 个待清理的临时目录")
+
+            if matching_dirs:
+                # 删除交给线程池执行，强制删除的重试和等待不再冻结界面
+                QThreadPool.globalInstance().start(TempCleanupWorker(matching_dirs))
         except Exception as e:
             logger.error(f"清理临时目录时出错: {str(e)}")
 
@@ -1564,44 +1684,8 @@ class MainWindow(QMainWindow):
             no_btn = msg_box.addButton("否", QMessageBox.NoRole)
             
             # 设置按钮样式
-            yes_btn.setMinimumWidth(100)
-            yes_btn.setMinimumHeight(35)
-            yes_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4d8bf0;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #3a7bd5;
-                }
-                QPushButton:pressed {
-                    background-color: #2a5db0;
-                }
-            """)
-            
-            no_btn.setMinimumWidth(100)
-            no_btn.setMinimumHeight(35)
-            no_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    color: #333333;
-                    border: 1px solid #d0d0d0;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-            """)
+            yes_btn.setObjectName("primaryButton")
+            no_btn.setObjectName("secondaryButton")
             
             # 显示对话框
             msg_box.exec_()
@@ -1610,8 +1694,9 @@ class MainWindow(QMainWindow):
             if msg_box.clickedButton() == no_btn:
                 return
         
-        # 清空预览列表
-        self.preview_list.clear()
+        # 清空预览列表（包括还未刷入模型的排队条目）
+        self._pending_previews.clear()
+        self.preview_model.clear()
         self.save_btn.setEnabled(False)
         
         # 重新启用选择压缩包按钮
@@ -1620,7 +1705,7 @@ class MainWindow(QMainWindow):
         # 重置进度条和排序信息
         self.progress_bar.setValue(0)
         self.sort_info_label.setText("排序: 等待解析...")
-        self.sort_info_label.setStyleSheet("font-size: 12px; color: #666666; margin-left: 10px;")
+        self._set_sort_tier("default")
         
         # 先强制关闭所有文件句柄
         self.force_close_handles()
@@ -1632,33 +1717,19 @@ class MainWindow(QMainWindow):
         cache_path = self.config.get("cache_path", "")
         if cache_path and os.path.exists(cache_path):
             try:
-                # 图片和视频文件扩展名
-                media_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', 
-                                  '.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv']
-                
                 # 查找要删除的文件
-                files_to_delete = []
-                for root, _, files in os.walk(cache_path):
-                    for file in files:
-                        file_ext = os.path.splitext(file)[1].lower()
-                        if file_ext in media_extensions:
-                            files_to_delete.append(os.path.join(root, file))
-                
+                files_to_delete = list(_iter_media_files(cache_path))
+
                 if not files_to_delete:
                     self.status_label.setText("没有找到可删除的缓存文件")
                     logger.info("没有找到可删除的缓存文件")
                     return
                 
-                # 删除文件
-                deleted_count = 0
-                for file_path in files_to_delete:
-                    try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                            deleted_count += 1
-                    except Exception as e:
-                        logger.warning(f"删除文件失败: {file_path}, 错误: {str(e)}")
-                
+                # 删除文件：线程池并行unlink，重叠每个文件的磁盘等待时间
+                max_workers = min(32, (os.cpu_count() or 4) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    deleted_count = sum(executor.map(_safe_unlink, files_to_delete))
+
                 self.status_label.setText(f"缓存清除完成，已删除 {deleted_count} 个文件")
                 logger.info(f"缓存清除完成，已删除 {deleted_count} 个文件")
                 
@@ -1674,8 +1745,8 @@ class MainWindow(QMainWindow):
     def auto_detect_cache_path(self):
         """自动检测微信缓存路径"""
         try:
-            # 获取微信收藏路径
-            favorites_path = WeChatParser.get_favorites_path()
+            # 获取微信收藏路径（结果缓存，避免重复扫描目录）
+            favorites_path = _detect_favorites_path()
             if favorites_path:
                 self.config["cache_path"] = favorites_path
                 logger.info(f"自动检测到微信缓存路径: {favorites_path}")
@@ -1686,8 +1757,9 @@ class MainWindow(QMainWindow):
     def auto_detect_and_fill(self):
         """自动检测并填充微信缓存路径"""
         try:
-            # 获取微信收藏路径
-            favorites_path = WeChatParser.get_favorites_path()
+            # 用户主动点击检测时清掉缓存，重新扫描一次
+            _detect_favorites_path.cache_clear()
+            favorites_path = _detect_favorites_path()
             if favorites_path:
                 self.cache_path_edit.setText(favorites_path)
                 CustomMessageBox.information(self, "成功", f"已自动检测到微信缓存路径:\n{favorites_path}")
@@ -1701,52 +1773,49 @@ class MainWindow(QMainWindow):
     
     def sort_by_time(self):
         """按时间重新排序预览列表"""
-        if self.preview_list.count() == 0:
+        if self.preview_model.rowCount() == 0:
             CustomMessageBox.information(self, "提示", "没有可排序的文件")
             return
         
         try:
-            # 获取所有文件信息
-            files_with_time = []
-            for i in range(self.preview_list.count()):
-                item = self.preview_list.item(i)
+            def _item_mtime(item):
+                """排序键：优先用发现阶段缓存的修改时间，避免逐个stat文件"""
                 file_info = item.data(Qt.UserRole)
-                
-                # 获取文件修改时间
-                try:
-                    mtime = os.path.getmtime(file_info['path'])
-                except:
-                    mtime = 0
-                
-                # 保存必要的显示信息，而不是保存item对象
-                files_with_time.append({
-                    'file_info': file_info,
-                    'mtime': mtime,
-                    'text': item.text(),
-                    'icon': item.icon(),
-                    'size_hint': item.sizeHint()
-                })
-            
-            # 按修改时间排序
-            files_with_time.sort(key=lambda x: x['mtime'])
-            
-            # 清空列表并重新添加
-            self.preview_list.clear()
-            for file_data in files_with_time:
-                # 重新创建列表项
-                item = QListWidgetItem()
-                item.setData(Qt.UserRole, file_data['file_info'])
-                item.setText(file_data['text'])
-                item.setIcon(file_data['icon'])
-                item.setTextAlignment(Qt.AlignCenter)
-                item.setSizeHint(file_data['size_hint'])
-                
-                self.preview_list.addItem(item)
-            
+                mtime = file_info.get('mtime')
+                if mtime is None:
+                    try:
+                        mtime = os.path.getmtime(file_info['path'])
+                        file_info['mtime'] = mtime
+                    except:
+                        mtime = 0
+                return mtime
+
+            # 整行取出后按原对象重新插入，图标和文本不经过任何复制
+            # 期间屏蔽模型逐行信号并暂停重绘，结束后一次性通知视图刷新
+            self.preview_list.setUpdatesEnabled(False)
+            blocker = QSignalBlocker(self.preview_model)
+            try:
+                items = []
+                while self.preview_model.rowCount() > 0:
+                    items.append(self.preview_model.takeRow(0)[0])
+
+                # 按修改时间排序
+                items.sort(key=_item_mtime)
+
+                for item in items:
+                    self.preview_model.appendRow(item)
+            finally:
+                del blocker
+                self.preview_model.layoutChanged.emit()
+                self.preview_list.setUpdatesEnabled(True)
+
+            # 排序后可视区域换了一批条目，补调一次可见缩略图加载
+            self._thumb_schedule_timer.start()
+
             # 更新排序信息
             self.sort_info_label.setText("排序: 按时间排序（手动）")
-            self.sort_info_label.setStyleSheet("font-size: 12px; color: #f0ad4e; margin-left: 10px; font-weight: bold;")
-            self.status_label.setText(f"已按时间重新排序 {self.preview_list.count()} 个文件")
+            self._set_sort_tier("good")
+            self.status_label.setText(f"已按时间重新排序 {self.preview_model.rowCount()} 个文件")
             logger.info("手动按时间排序完成")
             
         except Exception as e:
@@ -1759,8 +1828,9 @@ class MainWindow(QMainWindow):
         if file_path:
             logger.info(f"已选择压缩包文件: {file_path}")
             
-            # 清空预览列表
-            self.preview_list.clear()
+            # 清空预览列表（包括还未刷入模型的排队条目）
+            self._pending_previews.clear()
+            self.preview_model.clear()
             # 禁用保存按钮
             self.save_btn.setEnabled(False)
             # 重置进度条
@@ -1790,15 +1860,17 @@ class MainWindow(QMainWindow):
             
     def archive_parsing_finished(self):
         """压缩包解析完成"""
+        # 把还在队列里的条目刷进模型，保证计数准确
+        self._flush_preview_queue()
         self.parse_btn.setEnabled(True)
         self.archive_btn.setEnabled(True)
         # 如果有文件被解析，启用保存按钮
-        if self.preview_list.count() > 0:
+        if self.preview_model.rowCount() > 0:
             self.save_btn.setEnabled(True)
             
-            self.status_label.setText(f"压缩包解析完成，找到 {self.preview_list.count()} 个文件")
+            self.status_label.setText(f"压缩包解析完成，找到 {self.preview_model.rowCount()} 个文件")
             self.sort_info_label.setText("排序: 按资源名称数字顺序")
-            self.sort_info_label.setStyleSheet("font-size: 12px; color: #5cb85c; margin-left: 10px; font-weight: bold;")
+            self._set_sort_tier("best")
         else:
             self.status_label.setText("压缩包解析完成，未找到文件")
             self.sort_info_label.setText("排序: 无文件")
@@ -1833,11 +1905,12 @@ class MainWindow(QMainWindow):
             self.force_close_handles()
             self.clear_temp_archives()
             
-            # 保存配置
-            self.save_config()
+            # 保存配置（退出前立即落盘，不等去抖定时器）
+            self._config_save_timer.stop()
+            self._flush_config()
         except:
             pass
-        
+
         # 接受关闭事件
         event.accept()
 
@@ -1857,14 +1930,18 @@ class ParserThread(QThread):
         self.save_folder = save_folder
         self.preview_only = preview_only
         self.parsed_files = []
-        
+        self.parser = None  # run()构建后保留，供主窗口和保存线程复用
+        self.sort_strategy = None  # 解析完成后记录实际使用的排序策略
+
     def run(self):
         """执行解析任务"""
         try:
             # 初始化解析器
             self.status_updated.emit("正在初始化解析器...")
+            from utils.wechat_parser import WeChatParser
             parser = WeChatParser(self.cache_path)
-            
+            self.parser = parser
+
             # 获取文件总数
             self.status_updated.emit("正在获取文件列表...")
             total_files = parser.get_total_files()
@@ -1878,22 +1955,38 @@ class ParserThread(QThread):
             self.status_updated.emit(f"找到 {total_files} 个文件，开始解析...")
             
             # 解析文件
+            # 进度只在百分比变化时发射，状态最多每100ms发射一次，
+            # 避免跨线程排队信号淹没GUI线程
             saved_count = 0
+            last_progress = -1
+            last_status_time = 0.0
             for i, file_info in enumerate(parser.parse_favorites()):
                 progress = int((i + 1) / total_files * 100)
-                self.progress_updated.emit(progress)
-                
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_updated.emit(progress)
+
+                now = time.monotonic()
+                emit_status = now - last_status_time >= 0.1
+                if emit_status:
+                    last_status_time = now
+
                 if self.preview_only:
-                    self.status_updated.emit(f"正在解析: {file_info['name']} ({i+1}/{total_files})")
+                    if emit_status:
+                        self.status_updated.emit(f"正在解析: {file_info['name']} ({i+1}/{total_files})")
                     # 发送文件信息信号
                     self.file_found.emit(file_info)
                     self.parsed_files.append(file_info)
                 else:
-                    self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
+                    if emit_status:
+                        self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
                     # 保存文件
                     if parser.save_file(file_info, self.save_folder):
                         saved_count += 1
-            
+
+            # 排序策略在工作线程算好，主窗口直接读属性，不用再建解析器
+            self.sort_strategy = parser.get_sorting_strategy_info()
+
             if self.preview_only:
                 self.status_updated.emit(f"解析完成，已找到 {len(self.parsed_files)} 个文件")
             else:
@@ -1951,19 +2044,30 @@ class ArchiveParserThread(QThread):
             
             self.status_updated.emit(f"找到 {total_files} 个文件，开始解析...")
             
-            # 解析文件
+            # 解析文件（进度/状态信号做节流，避免跨线程信号刷爆事件循环）
             saved_count = 0
+            last_progress = -1
+            last_status_time = 0.0
             for i, file_info in enumerate(self.parser.parse_archive()):
                 progress = int((i + 1) / total_files * 100)
-                self.progress_updated.emit(progress)
-                
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_updated.emit(progress)
+
+                now = time.monotonic()
+                emit_status = now - last_status_time >= 0.1
+                if emit_status:
+                    last_status_time = now
+
                 if self.preview_only:
-                    self.status_updated.emit(f"正在解析: {file_info['name']} ({i+1}/{total_files})")
+                    if emit_status:
+                        self.status_updated.emit(f"正在解析: {file_info['name']} ({i+1}/{total_files})")
                     # 发送文件信息信号
                     self.file_found.emit(file_info)
                     self.parsed_files.append(file_info)
                 else:
-                    self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
+                    if emit_status:
+                        self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
                     # 保存文件
                     if self.parser.save_file(file_info, self.save_folder):
                         saved_count += 1
@@ -1993,19 +2097,21 @@ class SaveThread(QThread):
     error_occurred = pyqtSignal(str)
     finished = pyqtSignal()  # 添加finished信号
     
-    def __init__(self, files, save_folder, archive_parser=None):
+    def __init__(self, files, save_folder, archive_parser=None, wechat_parser=None):
         super().__init__()
         self.files = files
         self.save_folder = save_folder
         self.archive_parser = archive_parser
+        self.wechat_parser = wechat_parser  # 解析阶段已初始化的解析器，可直接复用
         self.cache_path = ""  # 存储缓存路径
         self.is_archive = False  # 标记是否为压缩包解析的文件
         self.safe_temp_dir = None  # 安全的临时目录，用于复制临时文件
         
         if files and len(files) > 0:
             # 检查是否为压缩包解析的文件
-            file_path = files[0]['path']
-            if "archive_extract_" in file_path.replace("\\", "/"):
+            # 统一成正斜杠后只做一次路径拆分，不再反复replace/split整个字符串
+            file_path = files[0]['path'].replace("\\", "/")
+            if "archive_extract_" in file_path:
                 self.is_archive = True
                 # 对于压缩包解析的文件，创建一个安全的临时目录
                 try:
@@ -2018,13 +2124,15 @@ class SaveThread(QThread):
                 self.cache_path = ""
             else:
                 # 从文件路径中提取缓存根目录，而不是使用完整文件路径
-                # 查找FileStorage/Fav或者Favorites目录
-                if "FileStorage/Fav" in file_path.replace("\\", "/"):
-                    parts = file_path.replace("\\", "/").split("FileStorage/Fav")
-                    self.cache_path = parts[0] + "FileStorage/Fav"
-                elif "Favorites" in file_path.replace("\\", "/"):
-                    parts = file_path.replace("\\", "/").split("Favorites")
-                    self.cache_path = parts[0] + "Favorites"
+                # 从后往前找FileStorage/Fav或者Favorites目录
+                parts = pathlib.PurePosixPath(file_path).parts
+                for i in range(len(parts) - 1, -1, -1):
+                    if parts[i] == 'FileStorage' and i + 1 < len(parts) and parts[i + 1] == 'Fav':
+                        self.cache_path = str(pathlib.PurePosixPath(*parts[:i + 2]))
+                        break
+                    if parts[i] == 'Favorites':
+                        self.cache_path = str(pathlib.PurePosixPath(*parts[:i + 1]))
+                        break
                 else:
                     # 如果无法找到明确的路径，使用文件所在目录
                     self.cache_path = os.path.dirname(file_path)
@@ -2128,10 +2236,13 @@ class SaveThread(QThread):
                 self.finished.emit()
                 return
             
-            # 初始化解析器 - 传入缓存路径而不是文件路径
+            # 初始化解析器 - 优先复用解析阶段的实例，避免重复初始化
             self.status_updated.emit("正在初始化...")
             try:
-                parser = WeChatParser(self.cache_path)
+                parser = self.wechat_parser
+                if parser is None:
+                    from utils.wechat_parser import WeChatParser
+                    parser = WeChatParser(self.cache_path)
                 self.save_files_with_parser(parser)
             except Exception as e:
                 # 如果使用解析器失败，回退到直接复制文件
@@ -2173,10 +2284,8 @@ class SaveThread(QThread):
         
         self.status_updated.emit(f"开始保存 {total_files} 个文件...")
         
-        # 详细记录保存路径信息
+        # 保存路径只记录一条，exists/isabs诊断信息不值得两次额外系统调用
         logger.info(f"保存目录: {self.save_folder}")
-        logger.info(f"保存目录是否存在: {os.path.exists(self.save_folder)}")
-        logger.info(f"保存目录是否为绝对路径: {os.path.isabs(self.save_folder)}")
         
         # 确保保存目录存在
         try:
@@ -2195,16 +2304,14 @@ class SaveThread(QThread):
         saved_count = 0
         failed_count = 0
         
-        # 记录所有文件的信息
-        logger.info("准备保存的文件列表:")
-        for i, file_info in enumerate(self.files[:5]):  # 只记录前5个文件
-            logger.info(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 存在={os.path.exists(file_info['path'])}")
-            if os.path.exists(file_info['path']):
+        # 抽查前5个文件，纯诊断用途，DEBUG级别才做stat
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, file_info in enumerate(self.files[:5]):
                 try:
-                    size = os.path.getsize(file_info['path'])
-                    logger.info(f"文件{i+1}大小: {size} 字节")
-                except Exception as e:
-                    logger.error(f"获取文件{i+1}大小失败: {str(e)}")
+                    st = os.stat(file_info['path'])
+                    logger.debug(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 大小: {st.st_size} 字节")
+                except OSError as e:
+                    logger.debug(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 无法访问: {str(e)}")
         
         # 逐个保存文件
         for i, file_info in enumerate(self.files):
@@ -2276,7 +2383,8 @@ class SaveThread(QThread):
         
         # 验证保存结果
         try:
-            saved_files = [f for f in os.listdir(self.save_folder) if os.path.isfile(os.path.join(self.save_folder, f))]
+            with os.scandir(self.save_folder) as entries:
+                saved_files = [entry.name for entry in entries if entry.is_file()]
             logger.info(f"保存目录中的文件数量: {len(saved_files)}")
             
             if len(saved_files) > 0:
@@ -2400,10 +2508,8 @@ class SaveThread(QThread):
         
         self.status_updated.emit(f"开始保存 {total_files} 个文件...")
         
-        # 详细记录保存路径信息
+        # 保存路径只记录一条，exists/isabs诊断信息不值得两次额外系统调用
         logger.info(f"保存目录: {self.save_folder}")
-        logger.info(f"保存目录是否存在: {os.path.exists(self.save_folder)}")
-        logger.info(f"保存目录是否为绝对路径: {os.path.isabs(self.save_folder)}")
         
         # 确保保存目录存在
         try:
@@ -2415,26 +2521,10 @@ class SaveThread(QThread):
             logger.error(error_msg)
             return
         
-        # 检查保存目录是否可写
-        try:
-            # 创建一个测试文件
-            test_file = os.path.join(self.save_folder, "test_write.txt")
-            with open(test_file, 'w') as f:
-                f.write("Test write permission")
-            
-            # 验证文件是否创建成功
-            if os.path.exists(test_file):
-                logger.info(f"测试文件创建成功: {test_file}")
-                # 删除测试文件
-                os.remove(test_file)
-                logger.info("测试文件已删除")
-            else:
-                logger.error("测试文件创建失败")
-                self.error_occurred.emit("无法在保存目录创建文件，请检查权限")
-                return
-        except Exception as e:
-            logger.error(f"测试写入权限失败: {str(e)}")
-            self.error_occurred.emit(f"测试写入权限失败: {str(e)}")
+        # 检查保存目录是否可写，省掉写测试文件再删除的三次系统调用
+        if not os.access(self.save_folder, os.W_OK):
+            logger.error("保存目录不可写")
+            self.error_occurred.emit("无法在保存目录创建文件，请检查权限")
             return
         
         # 计算序号的位数，确保排序正确
@@ -2444,73 +2534,55 @@ class SaveThread(QThread):
         saved_count = 0
         failed_count = 0
         
-        # 记录所有文件的信息
-        logger.info("准备保存的文件列表:")
-        for i, file_info in enumerate(self.files[:5]):  # 只记录前5个文件
-            logger.info(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 存在={os.path.exists(file_info['path'])}")
-            if os.path.exists(file_info['path']):
+        # 抽查前5个文件，纯诊断用途，DEBUG级别才做stat
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, file_info in enumerate(self.files[:5]):
                 try:
-                    size = os.path.getsize(file_info['path'])
-                    logger.info(f"文件{i+1}大小: {size} 字节")
-                except Exception as e:
-                    logger.error(f"获取文件{i+1}大小失败: {str(e)}")
+                    st = os.stat(file_info['path'])
+                    logger.debug(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 大小: {st.st_size} 字节")
+                except OSError as e:
+                    logger.debug(f"文件{i+1}: 名称={file_info['name']}, 路径={file_info['path']}, 无法访问: {str(e)}")
         
-        # 逐个保存文件
+        # 先按当前顺序算好全部带序号的目标文件名，排序不受并行完成顺序影响
+        tasks = []
         for i, file_info in enumerate(self.files):
-            # 进度更新
-            progress = int((i + 1) / total_files * 100)
-            self.progress_updated.emit(progress)
-            
-            file_path = file_info['path']
-            file_name = file_info['name']
-            
-            self.status_updated.emit(f"正在保存: {file_name} ({i+1}/{total_files})")
-            
-            # 检查源文件是否存在
+            sequence_number = str(i + 1).zfill(num_digits)
+            target_path = os.path.join(self.save_folder,
+                                       f"{sequence_number}_{file_info['name']}")
+            tasks.append((file_info['path'], file_info['name'], target_path))
+
+        def _copy_one(task):
+            """拷贝单个文件，返回(文件名, 是否成功)"""
+            file_path, file_name, target_path = task
             if not os.path.exists(file_path):
                 logger.error(f"源文件不存在: {file_path}")
-                failed_count += 1
-                continue
-            
+                return file_name, False
             try:
-                # 创建目标文件名
-                sequence_number = str(i + 1).zfill(num_digits)
-                target_filename = f"{sequence_number}_{file_name}"
-                target_path = os.path.join(self.save_folder, target_filename)
-                
-                logger.info(f"尝试保存文件: {file_path} -> {target_path}")
-                
-                # 直接使用二进制模式读写文件
-                with open(file_path, 'rb') as src_file:
-                    file_data = src_file.read()
-                    logger.info(f"已读取源文件，大小: {len(file_data)} 字节")
-                    
-                    with open(target_path, 'wb') as dst_file:
-                        dst_file.write(file_data)
-                        logger.info(f"已写入目标文件")
-                
-                # 验证文件是否成功保存
-                if os.path.exists(target_path):
-                    saved_size = os.path.getsize(target_path)
-                    logger.info(f"目标文件存在，大小: {saved_size} 字节")
-                    
-                    if saved_size > 0:
-                        saved_count += 1
-                        logger.info(f"文件保存成功: {target_filename}")
-                    else:
-                        logger.error(f"目标文件大小为0: {target_path}")
-                        failed_count += 1
+                _fast_copy(file_path, target_path)
+                if os.path.getsize(target_path) > 0:
+                    return file_name, True
+                logger.error(f"目标文件大小为0: {target_path}")
+                return file_name, False
+            except Exception as e:
+                logger.error(f"保存文件时出错: {target_path}, 错误: {str(e)}")
+                return file_name, False
+
+        # 并行提交拷贝任务，多个文件的磁盘等待相互重叠
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(_copy_one, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                file_name, ok = future.result()
+                if ok:
+                    saved_count += 1
                 else:
-                    logger.error(f"目标文件不存在: {target_path}")
                     failed_count += 1
-                    
-            except Exception as e:
-                logger.error(f"保存文件时出错: {str(e)}")
-                failed_count += 1
-        
+                self.progress_updated.emit(int(done / total_files * 100))
+                self.status_updated.emit(f"正在保存: {file_name} ({done}/{total_files})")
+
         # 验证保存结果
         try:
-            saved_files = [f for f in os.listdir(self.save_folder) if os.path.isfile(os.path.join(self.save_folder, f))]
+            with os.scandir(self.save_folder) as entries:
+                saved_files = [entry.name for entry in entries if entry.is_file()]
             logger.info(f"保存目录中的文件数量: {len(saved_files)}")
             
             if len(saved_files) > 0:
@@ -2564,10 +2636,8 @@ class SaveThread(QThread):
     
     def get_safe_filename(self, filename):
         """获取安全的文件名"""
-        # 移除非法字符
-        import re
-        import hashlib
-        safe_name = re.sub(r'[\\/*?:"<>|]', '_', filename)
+        # 移除非法字符（正则在模块加载时已编译好）
+        safe_name = UNSAFE_FILENAME_RE.sub('_', filename)
         
         # 确保文件名不为空
         if not safe_name or safe_name.startswith('.'):
@@ -2590,10 +2660,17 @@ class SaveThread(QThread):
         # 保存文件
         saved_count = 0
         failed_count = 0
+        last_progress = -1
+        last_status_time = 0.0
         for i, file_info in enumerate(self.files):
             progress = int((i + 1) / total_files * 100)
-            self.progress_updated.emit(progress)
-            self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
+            if progress != last_progress:
+                last_progress = progress
+                self.progress_updated.emit(progress)
+            now = time.monotonic()
+            if now - last_status_time >= 0.1:
+                last_status_time = now
+                self.status_updated.emit(f"正在保存: {file_info['name']} ({i+1}/{total_files})")
             
             # 添加序号信息到文件信息中
             sequence_number = str(i + 1).zfill(num_digits)
@@ -14,6 +14,9 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 独占创建目标文件用的标志位，O_EXCL让存在性检查和创建合成一次原子调用
+_EXCL_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
 class ArchiveParser:
     """压缩包解析工具类"""
     
@@ -291,7 +294,8 @@ class ArchiveParser:
                     'id': file_info['id'],
                     'name': file_info['name'],
                     'path': file_info['path'],
-                    'sort_key': file_info['sort_number']
+                    'sort_key': file_info['sort_number'],
+                    'mtime': file_info['mtime']
                 }
                 media_files.append(media_file)
             else:
@@ -311,7 +315,8 @@ class ArchiveParser:
                             'id': file_info['id'],
                             'name': file_info['name'],
                             'path': file_info['path'],
-                            'sort_key': file_info['sort_number']
+                            'sort_key': file_info['sort_number'],
+                            'mtime': file_info['mtime']
                         }
                         media_files.append(media_file)
                         logger.info(f"成功重新打开文件: {file_info['path']}")
@@ -358,19 +363,29 @@ class ArchiveParser:
         safe_name = self._get_safe_filename(file_info['name'])
         
         # 如果文件名已存在，添加序号
+        # EAFP：直接尝试独占创建，存在冲突时换名重试，省掉每个候选名一次stat
         target_path = os.path.join(save_folder, safe_name)
         base_name, ext = os.path.splitext(safe_name)
         counter = 1
-        
-        while os.path.exists(target_path):
-            safe_name = f"{base_name}_{counter}{ext}"
-            target_path = os.path.join(save_folder, safe_name)
-            counter += 1
-        
+
+        while True:
+            try:
+                fd = os.open(target_path, _EXCL_WRITE_FLAGS, 0o644)
+                break
+            except FileExistsError:
+                safe_name = f"{base_name}_{counter}{ext}"
+                target_path = os.path.join(save_folder, safe_name)
+                counter += 1
+            except OSError as e:
+                logger.error(f"创建目标文件失败: {target_path}, 错误: {str(e)}")
+                return False
+
         # 复制文件
         try:
             logger.info(f"保存文件: {file_info['path']} -> {target_path}")
-            shutil.copy2(file_info['path'], target_path)
+            with os.fdopen(fd, 'wb') as fdst, open(file_info['path'], 'rb') as fsrc:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            shutil.copystat(file_info['path'], target_path)
             return True
         except Exception as e:
             logger.error(f"保存文件失败: {str(e)}")
@@ -391,18 +406,28 @@ class ArchiveParser:
         prefixed_name = f"{sequence}_{safe_name}"
         
         # 如果文件名已存在，添加额外序号
+        # EAFP：直接尝试独占创建，存在冲突时换名重试，省掉每个候选名一次stat
         target_path = os.path.join(save_folder, prefixed_name)
         counter = 1
-        
-        while os.path.exists(target_path):
-            prefixed_name = f"{sequence}_{base_name}_{counter}{ext}"
-            target_path = os.path.join(save_folder, prefixed_name)
-            counter += 1
-        
+
+        while True:
+            try:
+                fd = os.open(target_path, _EXCL_WRITE_FLAGS, 0o644)
+                break
+            except FileExistsError:
+                prefixed_name = f"{sequence}_{base_name}_{counter}{ext}"
+                target_path = os.path.join(save_folder, prefixed_name)
+                counter += 1
+            except OSError as e:
+                logger.error(f"创建目标文件失败: {target_path}, 错误: {str(e)}")
+                return False
+
         # 复制文件
         try:
             logger.info(f"保存文件: {file_info['path']} -> {target_path}")
-            shutil.copy2(file_info['path'], target_path)
+            with os.fdopen(fd, 'wb') as fdst, open(file_info['path'], 'rb') as fsrc:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            shutil.copystat(file_info['path'], target_path)
             return True
         except Exception as e:
             logger.error(f"保存文件失败: {str(e)}")
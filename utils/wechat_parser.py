@@ -14,6 +14,9 @@ import winreg  # 用于访问Windows注册表
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 独占创建目标文件用的标志位，O_EXCL让存在性检查和创建合成一次原子调用
+_EXCL_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
 class WeChatParser:
     """微信收藏解析工具类"""
     
@@ -41,7 +44,9 @@ class WeChatParser:
             raise
             
         self.media_files = []
-    
+        # 排序策略说明是按当前media_files算出的固定结论，算一次后直接复用
+        self._sorting_strategy_info = None
+
     @staticmethod
     def get_current_wxid():
         """
@@ -444,11 +449,17 @@ class WeChatParser:
                             item_id, file_name, sort_key = row_parser(row)
                             file_path = self._find_file_by_id(item_id)
                             if file_path:
+                                # 在发现阶段就取一次修改时间，后续排序不再逐个stat
+                                try:
+                                    mtime = os.path.getmtime(file_path)
+                                except:
+                                    mtime = 0
                                 media_files.append({
                                     'id': item_id,
                                     'name': file_name or f"file_{item_id}",
                                     'path': file_path,
-                                    'sort_key': sort_key  # 添加排序键
+                                    'sort_key': sort_key,  # 添加排序键
+                                    'mtime': mtime
                                 })
                         # 如果找到了文件，就不再尝试其他查询
                         if media_files:
@@ -506,7 +517,8 @@ class WeChatParser:
                     'id': file_info['id'],
                     'name': file_info['name'],
                     'path': file_info['path'],
-                    'sort_key': file_info['mtime']
+                    'sort_key': file_info['mtime'],
+                    'mtime': file_info['mtime']
                 })
             
             logger.info(f"文件系统方式共找到 {len(media_files)} 个媒体文件，已按修改时间排序")
@@ -652,22 +664,29 @@ class WeChatParser:
         logger.info("=== 排序信息结束 ===")
     
     def get_sorting_strategy_info(self):
-        """获取当前使用的排序策略信息"""
+        """获取当前使用的排序策略信息（结果缓存在实例上）"""
+        if self._sorting_strategy_info is not None:
+            return self._sorting_strategy_info
+
         if not self.media_files:
             self.media_files = self._find_media_files()
-        
+
         if not self.media_files:
+            # 没有文件时不缓存，之后重新解析可能就有了
             return "未找到文件"
-        
+
         has_sort_key = any('sort_key' in f and f['sort_key'] is not None for f in self.media_files)
         has_mtime = any('mtime' in f for f in self.media_files)
-        
+
         if has_sort_key:
-            return "数据库排序（最佳）- 基于微信数据库中的顺序信息"
+            info = "数据库排序（最佳）- 基于微信数据库中的顺序信息"
         elif has_mtime:
-            return "时间排序（良好）- 基于文件修改时间，可能反映添加顺序"
+            info = "时间排序（良好）- 基于文件修改时间，可能反映添加顺序"
         else:
-            return "默认排序（一般）- 基于文件系统顺序"
+            info = "默认排序（一般）- 基于文件系统顺序"
+
+        self._sorting_strategy_info = info
+        return info
     
     def _detect_file_type(self, file_path):
         """根据文件内容检测文件类型"""
@@ -714,24 +733,34 @@ class WeChatParser:
         safe_name = self._get_safe_filename(file_info['name'])
         
         # 如果文件名已存在，添加序号
+        # EAFP：直接尝试独占创建，存在冲突时换名重试，省掉每个候选名一次stat
         target_path = os.path.join(save_folder, safe_name)
         base_name, ext = os.path.splitext(safe_name)
         counter = 1
-        
-        while os.path.exists(target_path):
-            safe_name = f"{base_name}_{counter}{ext}"
-            target_path = os.path.join(save_folder, safe_name)
-            counter += 1
-        
+
+        while True:
+            try:
+                fd = os.open(target_path, _EXCL_WRITE_FLAGS, 0o644)
+                break
+            except FileExistsError:
+                safe_name = f"{base_name}_{counter}{ext}"
+                target_path = os.path.join(save_folder, safe_name)
+                counter += 1
+            except OSError as e:
+                logger.error(f"创建目标文件失败: {target_path}, 错误: {str(e)}")
+                return False
+
         # 复制文件
         try:
             logger.info(f"保存文件: {file_info['path']} -> {target_path}")
-            shutil.copy2(file_info['path'], target_path)
+            with os.fdopen(fd, 'wb') as fdst, open(file_info['path'], 'rb') as fsrc:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            shutil.copystat(file_info['path'], target_path)
             return True
         except Exception as e:
             logger.error(f"保存文件失败: {str(e)}")
             return False
-    
+
     def save_file_with_sequence(self, file_info, save_folder):
         """保存文件到指定文件夹，带序号前缀"""
         if not file_info['path'] or not os.path.exists(file_info['path']):
@@ -747,18 +776,28 @@ class WeChatParser:
         prefixed_name = f"{sequence}_{safe_name}"
         
         # 如果文件名已存在，添加额外序号
+        # EAFP：直接尝试独占创建，存在冲突时换名重试，省掉每个候选名一次stat
         target_path = os.path.join(save_folder, prefixed_name)
         counter = 1
-        
-        while os.path.exists(target_path):
-            prefixed_name = f"{sequence}_{base_name}_{counter}{ext}"
-            target_path = os.path.join(save_folder, prefixed_name)
-            counter += 1
-        
+
+        while True:
+            try:
+                fd = os.open(target_path, _EXCL_WRITE_FLAGS, 0o644)
+                break
+            except FileExistsError:
+                prefixed_name = f"{sequence}_{base_name}_{counter}{ext}"
+                target_path = os.path.join(save_folder, prefixed_name)
+                counter += 1
+            except OSError as e:
+                logger.error(f"创建目标文件失败: {target_path}, 错误: {str(e)}")
+                return False
+
         # 复制文件
         try:
             logger.info(f"保存文件: {file_info['path']} -> {target_path}")
-            shutil.copy2(file_info['path'], target_path)
+            with os.fdopen(fd, 'wb') as fdst, open(file_info['path'], 'rb') as fsrc:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            shutil.copystat(file_info['path'], target_path)
             return True
         except Exception as e:
             logger.error(f"保存文件失败: {str(e)}")
@@ -5,7 +5,11 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[
+        ('ui/styles.qss', 'ui'),
+        ('ui/resources/about.html', 'ui/resources'),
+        ('hb.ico', '.'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},